@@ -1,16 +1,15 @@
 """Zen Mode: Minimalist autonomous agent runner."""
 
-from importlib.metadata import version, PackageNotFoundError
-
-try:
-    __version__ = version("zen-mode")
-except PackageNotFoundError:
-    __version__ = "0.0.0-dev"  # Not installed as package
-
-from zen_mode.context import Context
-from zen_mode.files import write_file, log
-from zen_mode.claude import run_claude
-from zen_mode.core import run
+# Public names are resolved on first access (PEP 562) so that importing the
+# package - e.g. for `zen --version` or `zen init` - does not pull in the
+# whole workflow engine or importlib.metadata.
+_LAZY_EXPORTS = {
+    "Context": "zen_mode.context",
+    "write_file": "zen_mode.files",
+    "log": "zen_mode.files",
+    "run_claude": "zen_mode.claude",
+    "run": "zen_mode.core",
+}
 
 __all__ = [
     "Context",
@@ -19,3 +18,29 @@ __all__ = [
     "run_claude",
     "run",
 ]
+
+
+def _read_version() -> str:
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        return version("zen-mode")
+    except PackageNotFoundError:
+        return "0.0.0-dev"  # Not installed as package
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        value = _read_version()
+    elif name in _LAZY_EXPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS) + ["__version__"])
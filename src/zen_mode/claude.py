@@ -1,12 +1,19 @@
 """Claude CLI wrapper for zen_mode."""
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import logging
+import operator
+import os
+import re
+import select
 import shutil
 import subprocess
+import threading
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from zen_mode.config import get_claude_exe, is_trusted_directory
 from zen_mode.exceptions import ConfigError
@@ -15,6 +22,23 @@ logger = logging.getLogger(__name__)
 
 _claude_exe: Optional[str] = None
 
+# Seconds to wait for the final result event once a stop marker is seen
+_STOP_GRACE_SECONDS = 2.0
+
+# Pre-spawned CLI processes blocked on stdin, keyed by (cmd, cwd)
+_spares: Dict[Tuple[Tuple[str, ...], str], subprocess.Popen] = {}
+_spares_lock = threading.Lock()
+
+_JSON_DECODER = json.JSONDecoder()
+
+_USAGE_KEYS = ("input_tokens", "output_tokens", "cache_read_input_tokens")
+_get_usage = operator.itemgetter(*_USAGE_KEYS)
+
+# Stream events _read_stream never looks at. "user" events carry tool results
+# (whole file contents), so skipping them by prefix avoids decoding the bulk
+# of the stream. Lines with other key orders are still parsed and ignored.
+_IGNORED_STREAM_EVENT = re.compile(r'\{\s*"type"\s*:\s*"(?:user|system)"')
+
 
 def _init_claude() -> str:
     """Initialize Claude CLI path. Returns path or exits."""
@@ -30,28 +54,292 @@ def _init_claude() -> str:
     return _claude_exe
 
 
+@functools.lru_cache(maxsize=32)
+def _claude_cmd(claude_exe: str, model: str, streaming: bool, skip_permissions: bool) -> Tuple[str, ...]:
+    """Build the CLI argv once per distinct (exe, model, mode, trust) combo."""
+    cmd = [claude_exe, "-p", "--model", model]
+    if skip_permissions:
+        cmd.insert(2, "--dangerously-skip-permissions")
+    if streaming:
+        # stream-json requires --verbose in print mode
+        cmd += ["--output-format", "stream-json", "--verbose"]
+    else:
+        cmd += ["--output-format", "json"]
+    return tuple(cmd)
+
+
+def _spawn(cmd: Tuple[str, ...], cwd: Path) -> subprocess.Popen:
+    """Start the CLI with piped stdio. It boots, then blocks reading stdin."""
+    return subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+        text=True,
+        encoding="utf-8",
+        errors="replace"
+    )
+
+
+def _take_spare(cmd: Tuple[str, ...], cwd: Path) -> Optional[subprocess.Popen]:
+    """Claim a warm spare process for this exact command, if one is alive."""
+    with _spares_lock:
+        proc = _spares.pop((cmd, str(cwd)), None)
+    if proc is not None and proc.poll() is not None:
+        return None
+    return proc
+
+
+def _replenish_spare(cmd: Tuple[str, ...], cwd: Path) -> None:
+    """Boot a spare process so the next identical call skips CLI start-up."""
+    key = (cmd, str(cwd))
+    with _spares_lock:
+        if key in _spares and _spares[key].poll() is None:
+            return
+        try:
+            _spares[key] = _spawn(cmd, cwd)
+        except OSError as e:
+            logger.debug(f"[PREWARM] Could not spawn spare: {e}")
+
+
+@atexit.register
+def _shutdown_spares() -> None:
+    """Terminate idle spare processes; they have not received a prompt."""
+    with _spares_lock:
+        spares = list(_spares.values())
+        _spares.clear()
+    for proc in spares:
+        try:
+            proc.kill()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+
 def _parse_json_response(stdout: str) -> Optional[dict]:
-    """Parse JSON from CLI output, stripping any warning prefixes."""
+    """Parse JSON from CLI output, stripping any warning prefixes.
+
+    Decodes in place from the first brace rather than slicing a copy of the
+    (possibly multi-MB) output first.
+    """
     start = stdout.find("{")
     if start == -1:
         return None
     try:
-        return json.loads(stdout[start:])
+        data, _ = _JSON_DECODER.raw_decode(stdout, start)
     except json.JSONDecodeError:
         return None
+    return data
 
 
 def _extract_cost(raw: dict) -> Tuple[float, Dict[str, int]]:
     """Extract cost and token counts from CLI JSON response."""
     cost = float(raw.get("total_cost_usd") or 0)
-    usage = raw.get("usage") or {}
+    usage = raw.get("usage")
+    try:
+        # Normal responses carry all three counters
+        i, o, c = _get_usage(usage)
+    except (KeyError, TypeError):
+        usage = usage or {}
+        i, o, c = (usage.get(k) for k in _USAGE_KEYS)
     return cost, {
-        "in": int(usage.get("input_tokens") or 0),
-        "out": int(usage.get("output_tokens") or 0),
-        "cache_read": int(usage.get("cache_read_input_tokens") or 0),
+        "in": int(i or 0),
+        "out": int(o or 0),
+        "cache_read": int(c or 0),
     }
 
 
+def last_line(text: str) -> str:
+    """Return the last non-blank line of text, ignoring surrounding whitespace.
+
+    Scans backward for the final newline instead of splitting the whole
+    (potentially very large) response into lines.
+    """
+    text = text.rstrip()
+    i = text.rfind("\n")
+    return text[i + 1:] if i >= 0 else text.lstrip()
+
+
+def _message_text(message: dict) -> str:
+    """Concatenate the text blocks of a stream-json assistant message."""
+    return "".join(
+        block.get("text") or ""
+        for block in message.get("content") or []
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
+def _has_tool_use(message: dict) -> bool:
+    """Check if a stream-json assistant message requests a tool call."""
+    return any(
+        isinstance(block, dict) and block.get("type") == "tool_use"
+        for block in message.get("content") or []
+    )
+
+
+def _ends_with_marker(message: dict, stop_markers: Tuple[str, ...]) -> bool:
+    """Check if an assistant message ends on a stop marker line.
+
+    Messages that also request a tool call are never final, so a marker
+    mentioned mid-task doesn't cut the run short.
+    """
+    if _has_tool_use(message):
+        return False
+    return last_line(_message_text(message)).strip().startswith(stop_markers)
+
+
+def _wait_exit(proc: subprocess.Popen, timeout: float) -> int:
+    """Wait for the process to exit, raising TimeoutExpired like Popen.wait.
+
+    Popen.wait(timeout) on POSIX is a sleep/waitpid loop. Where pidfds exist
+    (Linux 5.3+), block in a single poll() on the pidfd instead, then reap.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None or proc.returncode is not None:
+        return proc.wait(timeout=timeout)
+    try:
+        fd = pidfd_open(proc.pid)
+    except OSError:  # ENOSYS on older kernels, ESRCH if already reaped
+        return proc.wait(timeout=timeout)
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        if not poller.poll(timeout * 1000):
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+    finally:
+        os.close(fd)
+    return proc.wait()
+
+
+def _read_stream(
+    proc: subprocess.Popen,
+    timeout: int,
+    stop_markers: Tuple[str, ...],
+    text_callback: Optional[Callable[[str], None]] = None,
+) -> Tuple[Optional[dict], str, bool, bool]:
+    """Consume stream-json events until the result event or a stop marker.
+
+    A watchdog timer enforces ``timeout``. Once the model's final message
+    ends on a stop marker, the watchdog is swapped for a short grace period
+    so the CLI can still emit its result event (with cost) before being
+    terminated.
+
+    The CLI emits each content block of a message as its own event, so a
+    text block ending on a marker may still be followed by a tool_use block
+    of the same message. The grace period only starts once the message is
+    known to be complete: its ``stop_reason`` is ``end_turn``, or an event
+    for a different message arrives.
+
+    Args:
+        proc: Running CLI process with stdout/stderr pipes
+        timeout: Overall timeout in seconds
+        stop_markers: Line prefixes that mark the model's final answer
+        text_callback: Optional callback(text) for every assistant text event
+
+    Returns:
+        Tuple of (data, stderr, timed_out, stopped). ``data`` is the CLI's
+        result event, or a synthetic ``{"result", "usage"}`` dict built from
+        the stream when the process was stopped early; None if neither is
+        available. ``stopped`` is True if the process was signalled by us
+        rather than exiting on its own.
+    """
+    stderr_chunks: List[str] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+    )
+    stderr_reader.start()
+
+    timed_out = threading.Event()
+    stopped = threading.Event()
+
+    def _expire() -> None:
+        timed_out.set()
+        proc.kill()
+
+    def _stop() -> None:
+        stopped.set()
+        proc.terminate()
+
+    watchdog = threading.Timer(timeout, _expire)
+    watchdog.daemon = True
+    watchdog.start()
+
+    data: Optional[dict] = None
+    last_text: Optional[str] = None
+    usage_by_message: Dict[str, dict] = {}
+    # Id of a message whose latest block ended on a marker, until it completes
+    pending_id: Optional[str] = None
+    stopping = False
+    try:
+        for line in proc.stdout:
+            line = line.strip()
+            if not line.startswith("{") or _IGNORED_STREAM_EVENT.match(line):
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(event, dict):
+                continue
+
+            if event.get("type") == "result":
+                data = event
+                break
+            if event.get("type") != "assistant":
+                continue
+
+            message = event.get("message") or {}
+            message_id = message.get("id") or str(len(usage_by_message))
+            text = _message_text(message)
+            if text:
+                last_text = text
+                if text_callback:
+                    text_callback(text)
+            if message.get("usage"):
+                usage_by_message[message_id] = message["usage"]
+            if stopping:
+                continue
+
+            if pending_id is not None and message_id != pending_id:
+                # The marker message ended without requesting a tool
+                complete = True
+            elif _ends_with_marker(message, stop_markers):
+                pending_id = message_id
+                complete = message.get("stop_reason") == "end_turn"
+            else:
+                if pending_id is not None and (text or _has_tool_use(message)):
+                    pending_id = None
+                complete = False
+            if complete:
+                stopping = True
+                watchdog.cancel()
+                watchdog = threading.Timer(_STOP_GRACE_SECONDS, _stop)
+                watchdog.daemon = True
+                watchdog.start()
+    finally:
+        watchdog.cancel()
+
+    try:
+        _wait_exit(proc, 5)
+    except subprocess.TimeoutExpired:
+        stopped.set()
+        proc.kill()
+        proc.wait()
+    stderr_reader.join(timeout=5)
+    stderr = "".join(chunk for chunk in stderr_chunks if chunk)
+
+    if timed_out.is_set():
+        return None, stderr, True, True
+    if data is None and stopping:
+        usage: Dict[str, int] = {}
+        for message_usage in usage_by_message.values():
+            for key in ("input_tokens", "output_tokens", "cache_read_input_tokens"):
+                usage[key] = usage.get(key, 0) + int(message_usage.get(key) or 0)
+        data = {"result": last_text, "usage": usage}
+    return data, stderr, False, stopped.is_set()
+
+
 def run_claude(
     prompt: str,
     model: str,
@@ -62,6 +350,8 @@ def run_claude(
     log_fn: Optional[Callable[[str], None]] = None,
     cost_callback: Optional[Callable[..., Any]] = None,
     show_costs: bool = True,
+    stop_markers: Optional[Tuple[str, ...]] = None,
+    text_callback: Optional[Callable[[str], None]] = None,
 ) -> Optional[str]:
     """Run Claude CLI with prompt and return response.
 
@@ -74,6 +364,12 @@ def run_claude(
         log_fn: Optional logging function
         cost_callback: Optional callback(phase, cost, tokens) for cost tracking
         show_costs: Whether to log cost info
+        stop_markers: Optional final-line prefixes (e.g. "STEP_COMPLETE").
+            When given, output is streamed and the CLI is stopped as soon
+            as the model's final message ends on one of them.
+        text_callback: Optional callback(text) for the text of every
+            streamed assistant event, including markers the model emits
+            before its final message. Only called when stop_markers is given.
 
     Returns:
         Response text or None on error
@@ -89,40 +385,46 @@ def run_claude(
             logger.info(msg)
 
     claude_exe = _init_claude()
-    cmd = [claude_exe, "-p", "--model", model, "--output-format", "json"]
-
     # Skip Claude permission prompts if directory is trusted
     # Trust is determined by ZEN_TRUST_ROOTS (scope-limited) or ZEN_SKIP_PERMISSIONS (global)
-    if is_trusted_directory(project_root):
-        cmd.insert(2, "--dangerously-skip-permissions")
+    cmd = _claude_cmd(claude_exe, model, bool(stop_markers), is_trusted_directory(project_root))
     logger.debug(f"[CMD] {' '.join(cmd)} (cwd={project_root})")
+    from zen_mode.config import PREWARM_CLI
+
     proc = None
     try:
-        proc = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=project_root,
-            text=True,
-            encoding="utf-8",
-            errors="replace"
-        )
-        try:
-            proc.stdin.write(prompt)
-            proc.stdin.close()
-        except BrokenPipeError:
-            _log(f"[WARN] Claude ({model}) stdin closed early")
-        stdout, stderr = proc.communicate(timeout=timeout)
-
-        if proc.returncode != 0:
-            _log(f"[ERROR] Claude ({model}): {stderr[:300]}")
-            return None
+        proc = (_take_spare(cmd, project_root) if PREWARM_CLI else None) or _spawn(cmd, project_root)
+        if PREWARM_CLI:
+            _replenish_spare(cmd, project_root)
+        if stop_markers:
+            try:
+                proc.stdin.write(prompt)
+                proc.stdin.close()
+            except BrokenPipeError:
+                _log(f"[WARN] Claude ({model}) stdin closed early")
+            data, stderr, timed_out, stopped = _read_stream(proc, timeout, stop_markers, text_callback)
+            if timed_out:
+                _log(f"[ERROR] Claude ({model}) timed out")
+                return None
+            if data is None:
+                _log(f"[ERROR] Claude ({model}): no result in stream. {stderr[:300]}")
+                return None
+            if data.get("is_error") or (proc.returncode != 0 and not stopped):
+                _log(f"[ERROR] Claude ({model}): {stderr[:300]}")
+                return None
+        else:
+            # communicate() writes and closes stdin itself (ignoring BrokenPipe);
+            # on POSIX it raises ValueError if stdin was already closed by hand.
+            stdout, stderr = proc.communicate(input=prompt, timeout=timeout)
+
+            if proc.returncode != 0:
+                _log(f"[ERROR] Claude ({model}): {stderr[:300]}")
+                return None
 
-        data = _parse_json_response(stdout)
-        if data is None:
-            _log(f"[ERROR] Failed to parse JSON response (len={len(stdout)}, first_100={stdout[:100]!r})")
-            return None  # NOT raw stdout
+            data = _parse_json_response(stdout)
+            if data is None:
+                _log(f"[ERROR] Failed to parse JSON response (len={len(stdout)}, first_100={stdout[:100]!r})")
+                return None  # NOT raw stdout
 
         try:
             cost, tokens = _extract_cost(data)
@@ -1,16 +1,23 @@
 """
 Zen Mode CLI - argparse-based command line interface.
+
+argparse and the workflow modules are imported inside the branches that
+need them, so cheap commands like `zen --version` skip their import cost.
 """
-import argparse
+from __future__ import annotations
+
 import logging
 import os
 import sys
 from pathlib import Path
 from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
-from . import __version__
 from .exceptions import ZenError
 
+if TYPE_CHECKING:
+    import argparse
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging for the CLI.
@@ -37,6 +44,19 @@ def setup_logging(verbose: bool = False) -> None:
 logger = logging.getLogger(__name__)
 
 
+def _default_claude_md() -> bytes:
+    """Return the bundled CLAUDE.md template as raw bytes.
+
+    Read straight from the package directory; importlib.resources is only
+    needed when the package is not on a real filesystem (e.g. zipped).
+    """
+    try:
+        return (Path(__file__).parent / "defaults" / "CLAUDE.md").read_bytes()
+    except OSError:
+        import importlib.resources as resources
+        return resources.files("zen_mode.defaults").joinpath("CLAUDE.md").read_bytes()
+
+
 def cmd_init(args: argparse.Namespace) -> None:
     """Initialize .zen/ directory and create CLAUDE.md if none exists."""
     zen_dir = Path.cwd() / ".zen"
@@ -46,15 +66,7 @@ def cmd_init(args: argparse.Namespace) -> None:
     if not claude_md.exists():
         # Copy default template
         try:
-            import importlib.resources as resources
-            if hasattr(resources, 'files'):
-                # Python 3.9+
-                template = resources.files('zen_mode.defaults').joinpath('CLAUDE.md').read_text()
-            else:
-                # Python 3.7-3.8 fallback
-                with resources.open_text('zen_mode.defaults', 'CLAUDE.md') as f:
-                    template = f.read()
-            claude_md.write_text(template, encoding='utf-8')
+            claude_md.write_bytes(_default_claude_md())
             logger.info(f"Created {claude_md}")
         except Exception as e:
             logger.warning(f"Could not copy default CLAUDE.md: {e}")
@@ -180,6 +192,12 @@ def cmd_swarm(args: argparse.Namespace) -> None:
 
 
 def main() -> None:
+    # --version needs nothing but the version string; answer before any setup
+    if len(sys.argv) >= 2 and sys.argv[1] in ("--version", "-V"):
+        from . import __version__
+        print(f"zen-mode {__version__}")
+        return
+
     # Check for --verbose early so logging is configured before any output
     verbose = "--verbose" in sys.argv or "-v" in sys.argv
     setup_logging(verbose=verbose)
@@ -196,6 +214,7 @@ def main() -> None:
             return
         elif cmd == "swarm":
             # zen swarm <task1.md> [task2.md ...] [--workers N] [--strategy S] [--verbose] [--experimental]
+            import argparse
             parser = argparse.ArgumentParser(prog="zen swarm")
             parser.add_argument("tasks", nargs="+", help="Task files to execute in parallel")
             parser.add_argument("--workers", type=int, default=None, help="Number of parallel workers (default: auto)")
@@ -221,11 +240,9 @@ def main() -> None:
             return
         elif cmd in ("--help", "-h"):
             pass  # Let argparse handle it
-        elif cmd in ("--version", "-V"):
-            print(f"zen-mode {__version__}")
-            return
         elif not cmd.startswith("-"):
             # Assume it's a task file
+            import argparse
             parser = argparse.ArgumentParser(prog="zen")
             parser.add_argument("task_file", help="Path to task markdown file")
             parser.add_argument("--reset", action="store_true", help="Reset work directory")
@@ -241,6 +258,7 @@ def main() -> None:
             return
 
     # Default: show help
+    from . import __version__
     print(f"""zen-mode {__version__} - Minimalist Autonomous Agent Runner
 
 Usage:
@@ -3,12 +3,13 @@ Zen Mode Configuration.
 
 Centralized configuration constants. All env vars and defaults in one place.
 """
+import functools
 import logging
 import os
 import re
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from zen_mode.exceptions import ConfigError
 
@@ -18,6 +19,10 @@ logger = logging.getLogger(__name__)
 # -----------------------------------------------------------------------------
 # Validation Helpers
 # -----------------------------------------------------------------------------
+_ALLOWED_MODELS = {"opus", "sonnet", "haiku"}
+_INVALID_DIR_CHARS = re.compile(r'[<>:"|?*\x00-\x1f]')
+
+
 def _get_int_env(name: str, default: str, min_val: int = 0) -> int:
     """Get integer from env var with validation.
 
@@ -55,10 +60,9 @@ def _get_model_env(name: str, default: str) -> str:
     Raises:
         ConfigError: If model name is not in allowlist
     """
-    allowed = {"opus", "sonnet", "haiku"}
     val = os.getenv(name, default)
-    if val not in allowed:
-        raise ConfigError(f"{name}={val!r} not in {allowed}")
+    if val not in _ALLOWED_MODELS:
+        raise ConfigError(f"{name}={val!r} not in {_ALLOWED_MODELS}")
     return val
 
 
@@ -111,7 +115,7 @@ def _get_dir_name_env(name: str, default: str) -> str:
     if not val.strip():
         raise ConfigError(f"{name} cannot be empty or whitespace")
     # Reject names that would be problematic on Windows or Unix
-    if re.search(r'[<>:"|?*\x00-\x1f]', val):
+    if _INVALID_DIR_CHARS.search(val):
         raise ConfigError(f"{name}={val!r} contains invalid characters")
     return val
 
@@ -193,6 +197,9 @@ TIMEOUT_SUMMARY = _get_int_env("ZEN_SUMMARY_TIMEOUT", "180", min_val=1)
 # Retries / Loops
 # -----------------------------------------------------------------------------
 MAX_RETRIES = _get_int_env("ZEN_RETRIES", "2", min_val=0)
+MAX_PARALLEL_STEPS = _get_int_env("ZEN_PARALLEL_STEPS", "1", min_val=1)
+MAX_BATCH_STEPS = _get_int_env("ZEN_BATCH_STEPS", "1", min_val=1)
+ESCALATE_ON_REPEAT = _get_bool_env("ZEN_ESCALATE_ON_REPEAT", "false")
 MAX_FIX_ATTEMPTS = _get_int_env("ZEN_FIX_ATTEMPTS", "2", min_val=0)
 MAX_JUDGE_LOOPS = _get_int_env("ZEN_JUDGE_LOOPS", "2", min_val=0)
 
@@ -225,6 +232,12 @@ TEST_OUTPUT_PATH_STR = WORK_DIR_NAME + "/test_output.txt"  # For prompts
 # -----------------------------------------------------------------------------
 SHOW_COSTS = _get_bool_env("ZEN_SHOW_COSTS", "true")
 
+# -----------------------------------------------------------------------------
+# CLI Process Reuse
+# -----------------------------------------------------------------------------
+# Keep a spare claude process booted (waiting on stdin) for the next call
+PREWARM_CLI = _get_bool_env("ZEN_PREWARM", "false")
+
 # -----------------------------------------------------------------------------
 # Cost Budget
 # -----------------------------------------------------------------------------
@@ -333,19 +346,32 @@ def is_trusted_directory(cwd: Path) -> bool:
     Returns:
         True if directory is trusted for skip-permissions
     """
-    trust_roots = _get_trust_roots()
-    if not trust_roots:
+    raw = os.getenv("ZEN_TRUST_ROOTS", "")
+    if not raw.strip():
         # No roots specified - fall back to global SKIP_PERMISSIONS
         return _get_skip_permissions()
 
-    cwd_path = cwd.resolve()
-    for root_path in trust_roots:
-        try:
-            cwd_path.relative_to(root_path)
-            return True
-        except ValueError:
-            continue
-    return False
+    cwd_str = os.path.normcase(str(cwd.resolve()))
+    return any(cwd_str == root or cwd_str.startswith(prefix)
+               for root, prefix in _trust_root_prefixes(raw))
+
+
+@functools.lru_cache(maxsize=8)
+def _trust_root_prefixes(raw: str) -> Tuple[Tuple[str, str], ...]:
+    """Resolve ZEN_TRUST_ROOTS once per distinct value.
+
+    Returns (root, root + separator) pairs, normcased, so containment is a
+    string comparison instead of a resolve() per root per call.
+
+    Raises:
+        ConfigError: If any specified path does not exist (not cached)
+    """
+    pairs = []
+    for root_path in _get_trust_roots():
+        root = os.path.normcase(str(root_path))
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        pairs.append((root, prefix))
+    return tuple(pairs)
 
 
 def get_claude_exe() -> Optional[str]:
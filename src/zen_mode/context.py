@@ -1,9 +1,10 @@
 """Execution context for zen_mode phases."""
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from zen_mode.exceptions import CostBudgetExceeded
 
@@ -17,6 +18,7 @@ class Context:
     flags: Set[str] = field(default_factory=set)
     costs: List[Dict[str, Any]] = field(default_factory=list)
     tokens: int = 0
+    total_cost: float = 0.0
 
     # Derived paths (computed on first access)
     _scout_file: Optional[Path] = field(default=None, repr=False)
@@ -27,6 +29,13 @@ class Context:
     _test_output_file: Optional[Path] = field(default=None, repr=False)
     _baseline_file: Optional[Path] = field(default=None, repr=False)
 
+    # Cached plan text, keyed by the plan file's stat signature
+    _plan_text: Optional[str] = field(default=None, repr=False)
+    _plan_sig: Optional[Tuple[int, int, int]] = field(default=None, repr=False)
+
+    # Parallel plan steps record costs from worker threads
+    _cost_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
     @property
     def scout_file(self) -> Path:
         if self._scout_file is None:
@@ -69,6 +78,22 @@ class Context:
             self._baseline_file = self.work_dir / "lint_baseline.json"
         return self._baseline_file
 
+    def read_plan(self) -> str:
+        """Return the plan text, re-reading plan.md only when it changed.
+
+        Implement, judge and summary all need the plan; the file is only
+        rewritten by the plan phase (or dropped on fast-track escalation).
+
+        Raises:
+            FileNotFoundError: If plan.md does not exist
+        """
+        st = self.plan_file.stat()
+        sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._plan_text is None or sig != self._plan_sig:
+            self._plan_text = self.plan_file.read_text(encoding="utf-8")
+            self._plan_sig = sig
+        return self._plan_text
+
     def record_cost(self, phase: str, cost: float, tokens: Dict[str, int]) -> None:
         """Record cost and tokens for a phase.
 
@@ -80,18 +105,21 @@ class Context:
         Raises:
             CostBudgetExceeded: If total cost exceeds MAX_COST_PER_TASK (when > 0)
         """
-        self.costs.append({
-            "phase": phase,
-            "cost": cost,
-            "tokens": tokens,
-        })
-        self.tokens += tokens.get("in", 0) + tokens.get("out", 0)
+        with self._cost_lock:
+            self.costs.append({
+                "phase": phase,
+                "cost": cost,
+                "tokens": tokens,
+            })
+            self.tokens += tokens.get("in", 0) + tokens.get("out", 0)
+            # Running total, so the budget check doesn't re-sum every entry
+            self.total_cost += cost
+            total_cost = self.total_cost
 
         # Check budget if configured (MAX_COST_PER_TASK > 0)
         # Import dynamically to pick up any runtime changes to config
         from zen_mode.config import MAX_COST_PER_TASK
         if MAX_COST_PER_TASK > 0:
-            total_cost = sum(entry["cost"] for entry in self.costs)
             if total_cost > MAX_COST_PER_TASK:
                 raise CostBudgetExceeded(
                     f"Cost budget exceeded: ${total_cost:.4f} > ${MAX_COST_PER_TASK:.4f}\n"
@@ -19,7 +19,7 @@ from zen_mode.claude import run_claude
 from zen_mode.config import MODEL_EYES, WORK_DIR_NAME, PROJECT_ROOT
 from zen_mode.context import Context
 from zen_mode.exceptions import ZenError, ConfigError, VerifyError
-from zen_mode.files import write_file, log
+from zen_mode.files import close_log, drop_lines_containing, write_file, log
 from zen_mode.implement import phase_implement_ctx
 from zen_mode.judge import phase_judge_ctx, should_skip_judge_ctx
 from zen_mode.plan import phase_plan_ctx
@@ -31,26 +31,27 @@ from zen_mode.verify import verify_and_fix, project_has_tests, VerifyTimeout
 # -----------------------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------------------
+# Touched in the work dir once the cost summary closes out a successful run
+_COMPLETION_SENTINEL = ".completed"
+
 
 def _write_cost_summary(ctx: Context) -> None:
     """Write cost summary to log and final_notes."""
     if not ctx.costs:
         return
 
-    # Aggregate costs by phase
+    # Aggregate costs by phase; token totals only matter for the whole run
     phase_costs: Dict[str, float] = {}
-    phase_tokens: Dict[str, Dict[str, int]] = {}
+    total_in = total_out = total_cache = 0
     for entry in ctx.costs:
         p = entry["phase"]
         phase_costs[p] = phase_costs.get(p, 0) + entry["cost"]
-        phase_tokens.setdefault(p, {"in": 0, "out": 0, "cache_read": 0})
-        for k, v in entry["tokens"].items():
-            phase_tokens[p][k] = phase_tokens[p].get(k, 0) + v
+        tokens = entry["tokens"]
+        total_in += tokens.get("in", 0)
+        total_out += tokens.get("out", 0)
+        total_cache += tokens.get("cache_read", 0)
 
     total = sum(phase_costs.values())
-    total_in = sum(t["in"] for t in phase_tokens.values())
-    total_out = sum(t["out"] for t in phase_tokens.values())
-    total_cache = sum(t.get("cache_read", 0) for t in phase_tokens.values())
     breakdown = ", ".join(f"{k}=${v:.3f}" for k, v in phase_costs.items())
 
     summary = f"[COST] Total: ${total:.3f} ({breakdown})"
@@ -58,18 +59,27 @@ def _write_cost_summary(ctx: Context) -> None:
     # Log to file and console
     log(summary, ctx.log_file, ctx.work_dir)
 
-    # Append to final_notes.md
+    # Append to final_notes.md as one block, in a single write
+    block = (
+        "\n## Cost Summary\n"
+        f"Total: ${total:.3f}\n"
+        f"Tokens: {total_in} in, {total_out} out, {total_cache} cache read\n"
+        f"Breakdown: {breakdown}\n"
+    )
     with ctx.notes_file.open("a", encoding="utf-8") as f:
-        f.write("\n## Cost Summary\n")
-        f.write(f"Total: ${total:.3f}\n")
-        f.write(f"Tokens: {total_in} in, {total_out} out, {total_cache} cache read\n")
-        f.write(f"Breakdown: {breakdown}\n")
+        f.write(block)
+    (ctx.work_dir / _COMPLETION_SENTINEL).touch()
 
 
 def _check_previous_completion(notes_file: Path) -> bool:
     """Check if previous run completed successfully."""
+    # A deleted final_notes.md means the summary must be rewritten, even if
+    # the sentinel from an earlier run is still there
     if not notes_file.exists():
         return False
+    if (notes_file.parent / _COMPLETION_SENTINEL).exists():
+        return True
+    # Work dirs from before the sentinel: look for the cost summary itself
     try:
         content = notes_file.read_text(encoding="utf-8")
         return "## Cost Summary" in content
@@ -77,6 +87,27 @@ def _check_previous_completion(notes_file: Path) -> bool:
         return False
 
 
+def _resolve_in_project(path_str: str, project_root: Path, label: str) -> Path:
+    """Resolve a user-supplied file path that must exist inside the project.
+
+    A strict resolve checks existence in the same walk; the lenient resolve
+    only runs when the file is missing, to report the right error.
+
+    Raises:
+        ConfigError: If the path is outside project_root or does not exist
+    """
+    path = Path(path_str)
+    try:
+        resolved: Optional[Path] = path.resolve(strict=True)
+    except OSError:
+        resolved = None
+    if not (resolved or path.resolve()).is_relative_to(project_root):
+        raise ConfigError(f"{label} must be within project directory: {path_str}")
+    if resolved is None:
+        raise ConfigError(f"{label} not found: {path_str}")
+    return resolved
+
+
 # -----------------------------------------------------------------------------
 # Public API
 # -----------------------------------------------------------------------------
@@ -93,12 +124,8 @@ def run(task_file: str, flags: Optional[set] = None, scout_context: Optional[str
     """
     flags = flags or set()
 
-    task_path = Path(task_file)
-    resolved_path = task_path.resolve()
-    if not resolved_path.is_relative_to(PROJECT_ROOT.resolve()):
-        raise ConfigError(f"Task file must be within project directory: {task_file}")
-    if not task_path.exists():
-        raise ConfigError(f"Task file not found: {task_file}")
+    project_root = PROJECT_ROOT.resolve()
+    _resolve_in_project(task_file, project_root, "Task file")
 
     # Set up paths (local, not global)
     work_dir = PROJECT_ROOT / WORK_DIR_NAME
@@ -107,6 +134,7 @@ def run(task_file: str, flags: Optional[set] = None, scout_context: Optional[str
 
     if "--reset" in flags:
         if work_dir.exists():
+            close_log(log_file)
             shutil.rmtree(work_dir)
         logger.info("Reset complete.")
         work_dir.mkdir(exist_ok=True)
@@ -118,9 +146,7 @@ def run(task_file: str, flags: Optional[set] = None, scout_context: Optional[str
         return
 
     if "--retry" in flags and log_file.exists():
-        lines = log_file.read_text(encoding="utf-8").splitlines()
-        cleaned = "\n".join(line for line in lines if "[COMPLETE] Step" not in line)
-        write_file(log_file, cleaned, work_dir)
+        drop_lines_containing(log_file, "[COMPLETE] Step", work_dir)
         logger.info("Cleared completion markers.")
 
     skip_judge = "--skip-judge" in flags
@@ -140,12 +166,7 @@ def run(task_file: str, flags: Optional[set] = None, scout_context: Optional[str
     try:
         # Scout phase
         if scout_context:
-            scout_path = Path(scout_context)
-            resolved_scout = scout_path.resolve()
-            if not resolved_scout.is_relative_to(PROJECT_ROOT.resolve()):
-                raise ConfigError(f"Scout context file must be within project directory: {scout_context}")
-            if not scout_path.exists():
-                raise ConfigError(f"Scout context file not found: {scout_context}")
+            scout_path = _resolve_in_project(scout_context, project_root, "Scout context file")
             ctx.work_dir.mkdir(exist_ok=True)
             shutil.copy(str(scout_path), str(ctx.scout_file))
             _log(f"[SCOUT] Using provided context: {scout_context}")
@@ -181,9 +202,7 @@ def run(task_file: str, flags: Optional[set] = None, scout_context: Optional[str
                 if ctx.plan_file.exists():
                     ctx.plan_file.unlink()
                 if ctx.log_file.exists():
-                    lines = ctx.log_file.read_text(encoding="utf-8").splitlines()
-                    cleaned = "\n".join(line for line in lines if "[COMPLETE] Step" not in line)
-                    write_file(ctx.log_file, cleaned, ctx.work_dir)
+                    drop_lines_containing(ctx.log_file, "[COMPLETE] Step", ctx.work_dir)
 
         if not fast_track_succeeded:
             # Standard path
@@ -203,7 +222,7 @@ def run(task_file: str, flags: Optional[set] = None, scout_context: Optional[str
                 _log("[JUDGE] Skipped (--skip-judge flag)")
 
         # Generate summary
-        plan = ctx.plan_file.read_text(encoding="utf-8")
+        plan = ctx.read_plan()
         summary = run_claude(
             f"Summarize the completed changes in 3-5 bullets.\n\nPlan:\n{plan}",
             model=MODEL_EYES,
@@ -1,15 +1,18 @@
 """File I/O utilities for zen_mode."""
 from __future__ import annotations
 
+import atexit
 import fnmatch
 import logging
+import mmap
+import os
 import re
 import shutil
-import tempfile
+import threading
 import time
 from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional, Set, Tuple
+from typing import Callable, Dict, Optional, Set, TextIO, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +90,15 @@ BINARY_EXTS: Set[str] = {
 }
 
 
+# IGNORE_DIRS globs as one regex, matched like fnmatch (normcase'd names)
+_IGNORE_DIR_GLOBS = (
+    re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in IGNORE_DIRS if "*" in p))
+    if any("*" in p for p in IGNORE_DIRS) else None
+)
+# str.endswith takes a tuple: one C call instead of a generator over BINARY_EXTS
+_BINARY_EXTS_TUPLE = tuple(BINARY_EXTS)
+
+
 def should_ignore_path(path_str: str) -> bool:
     """Check if path should be filtered from git changes and processing.
 
@@ -102,26 +114,33 @@ def should_ignore_path(path_str: str) -> bool:
     Returns:
         True if path should be ignored, False otherwise
     """
-    path = Path(path_str)
+    # Plain string splitting: this runs per file on scans, and a Path
+    # object per call costs more than the checks themselves
+    path_str = os.fspath(path_str)
+    if os.altsep:
+        path_str = path_str.replace(os.altsep, os.sep)
+    # Drop empty and "." parts, as Path.parts would
+    parts = [part for part in path_str.split(os.sep) if part and part != "."]
+    name = parts[-1] if parts else ""
 
     # Check if any part of the path is an ignored directory
-    for part in path.parts:
+    for part in parts:
         # Check exact match in IGNORE_DIRS
         if part in IGNORE_DIRS:
             return True
         # Check glob patterns in IGNORE_DIRS (e.g., *.egg-info)
-        if any(fnmatch.fnmatch(part, pattern) for pattern in IGNORE_DIRS if '*' in pattern):
+        if _IGNORE_DIR_GLOBS is not None and _IGNORE_DIR_GLOBS.match(os.path.normcase(part)):
             return True
         # Check if starts with dot (hidden directory)
         if part.startswith('.'):
             return True
 
     # Check if filename is in IGNORE_FILES
-    if path.name in IGNORE_FILES:
+    if name in IGNORE_FILES:
         return True
 
     # Check if file has a binary extension
-    if any(path.name.endswith(ext) for ext in BINARY_EXTS):
+    if name.endswith(_BINARY_EXTS_TUPLE):
         return True
 
     return False
@@ -129,30 +148,91 @@ def should_ignore_path(path_str: str) -> bool:
 
 def write_file(path: Path, content: str, work_dir: Optional[Path] = None) -> None:
     """Write content to file atomically."""
-    if work_dir:
-        work_dir.mkdir(exist_ok=True)
-        temp_dir = work_dir
-    else:
+    temp_dir = work_dir or path.parent
+    # A cached log handle would keep appending to the replaced file
+    if str(path) in _log_handles:
+        close_log(path)
+
+    # Unique per process and thread so concurrent writers never share a temp file
+    tmp = temp_dir / f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    data = memoryview(content.encode("utf-8", "replace"))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(tmp, flags, 0o666)
+    except FileNotFoundError:
+        # Create directories only on first use instead of on every write
+        temp_dir.mkdir(parents=True, exist_ok=True)
         path.parent.mkdir(parents=True, exist_ok=True)
-        temp_dir = path.parent
+        fd = os.open(tmp, flags, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    except OSError:
+        os.close(fd)
+        tmp.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    _replace_atomic(tmp, path)
 
-    with tempfile.NamedTemporaryFile("w", dir=temp_dir, delete=False, encoding="utf-8") as tf:
-        tf.write(content)
-        tmp = tf.name
 
-    # Atomic replace with Windows retry
+def _replace_atomic(tmp: Path, path: Path) -> None:
+    """Move a finished temp file over path, with a retry for Windows."""
     try:
-        Path(tmp).replace(path)
+        os.replace(tmp, path)
     except OSError:
         # Windows: file may be busy (virus scanner, IDE)
         time.sleep(0.3)
         try:
-            Path(tmp).replace(path)
+            os.replace(tmp, path)
         except OSError as e:
-            Path(tmp).unlink(missing_ok=True)
+            tmp.unlink(missing_ok=True)
             raise OSError(f"Failed to write {path}: {e}")
 
 
+def drop_lines_containing(path: Path, marker: str, work_dir: Optional[Path] = None) -> None:
+    """Atomically rewrite path without the lines that contain marker.
+
+    Works on an mmap of the file: mmap.find jumps between occurrences of the
+    (single-line) marker, and the spans between matching lines are written
+    out unchanged, so untouched lines keep their exact bytes and line
+    endings without a Python-level pass over every line. A file without the
+    marker is left alone.
+    """
+    needle = marker.encode("utf-8")
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(needle) == -1:
+                return
+
+    temp_dir = work_dir or path.parent
+    if str(path) in _log_handles:
+        close_log(path)
+
+    tmp = temp_dir / f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(path, "rb") as src, open(tmp, "wb") as dst:
+            size = os.fstat(src.fileno()).st_size
+            if size:
+                with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as view:
+                    keep_from = 0
+                    hit = mm.find(needle)
+                    while hit != -1:
+                        line_start = mm.rfind(b"\n", 0, hit) + 1
+                        line_end = mm.find(b"\n", hit)
+                        line_end = size if line_end == -1 else line_end + 1
+                        dst.write(view[keep_from:line_start])
+                        keep_from = line_end
+                        hit = mm.find(needle, line_end)
+                    dst.write(view[keep_from:])
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    _replace_atomic(tmp, path)
+
+
 def backup_file(path: Path, backup_dir: Path, project_root: Path, log_fn: Optional[Callable[[str], None]] = None) -> None:
     """Create a backup of a file before modification."""
     if not path.exists():
@@ -172,6 +252,32 @@ def backup_file(path: Path, backup_dir: Path, project_root: Path, log_fn: Option
             log_fn(f"[BACKUP] {rel_path}")
 
 
+_CONSTITUTION_PATH = Path(__file__).parent / "defaults" / "CLAUDE.md"
+
+# One "## NAME" or "## NAME (subtitle)" section, through the next ## or EOF
+_CONSTITUTION_SECTION_PATTERN = re.compile(
+    r"^## (.*?)(?:\s*$|\s+\().*?(?=^## |\Z)", re.MULTILINE | re.DOTALL
+)
+
+
+@lru_cache(maxsize=1)
+def _constitution_sections(mtime_ns: int) -> Dict[str, str]:
+    """Parse defaults/CLAUDE.md into {casefolded section name: section text}.
+
+    Keyed on mtime_ns so an edited file is re-parsed; the first section
+    wins when a name repeats.
+    """
+    try:
+        content = _CONSTITUTION_PATH.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        logger.error(f"Failed to load constitution from {_CONSTITUTION_PATH}: {e}")
+        return {}
+    sections: Dict[str, str] = {}
+    for match in _CONSTITUTION_SECTION_PATTERN.finditer(content):
+        sections.setdefault(match.group(1).casefold(), match.group().strip())
+    return sections
+
+
 def load_constitution(*sections: str) -> str:
     """Load specified sections from defaults/CLAUDE.md constitution.
 
@@ -188,25 +294,12 @@ def load_constitution(*sections: str) -> str:
         >>> load_constitution("GOLDEN RULES", "ARCHITECTURE")
         '## GOLDEN RULES\\n- Verify, then Delete...\\n\\n## ARCHITECTURE\\n...'
     """
-    constitution_path = Path(__file__).parent / "defaults" / "CLAUDE.md"
-    if not constitution_path.exists():
-        return ""
-
     try:
-        content = constitution_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError) as e:
-        logger.error(f"Failed to load constitution from {constitution_path}: {e}")
+        mtime_ns = _CONSTITUTION_PATH.stat().st_mtime_ns
+    except OSError:
         return ""
-    result = []
-
-    for section in sections:
-        # Match ## SECTION_NAME through next ## or EOF (case-insensitive)
-        # Section name must be followed by: end-of-line, or space+paren (for subtitles)
-        pattern = rf"^## {re.escape(section)}(?:\s*$|\s+\().*?(?=^## |\Z)"
-        match = re.search(pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
-        if match:
-            result.append(match.group().strip())
-
+    by_name = _constitution_sections(mtime_ns)
+    result = [by_name[s.casefold()] for s in sections if s.casefold() in by_name]
     return "\n\n".join(result)
 
 
@@ -253,11 +346,59 @@ def _get_full_constitution_cached(project_root_str: str, sections: Tuple[str, ..
     return zen_rules
 
 
-def log(msg: str, log_file: Path, work_dir: Path) -> None:
-    """Log message to file and stdout."""
+# Serializes log appends when plan steps run concurrently
+_LOG_LOCK = threading.Lock()
+
+# Open append handles keyed by log path: (handle, st_ino, st_dev)
+_log_handles: Dict[str, Tuple[TextIO, int, int]] = {}
+_MAX_LOG_HANDLES = 8
+
+
+def close_log(log_file: Optional[Path] = None) -> None:
+    """Close the cached handle for log_file (or all) so it can be replaced or removed."""
+    with _LOG_LOCK:
+        keys = [str(log_file)] if log_file is not None else list(_log_handles)
+        for key in keys:
+            entry = _log_handles.pop(key, None)
+            if entry is not None:
+                entry[0].close()
+
+
+atexit.register(close_log)
+
+
+def _log_handle(log_file: Path, work_dir: Path) -> TextIO:
+    """Return an open append handle for log_file. Caller holds _LOG_LOCK."""
+    key = str(log_file)
+    entry = _log_handles.get(key)
+    if entry is not None:
+        # Reopen if the file was deleted or replaced underneath us
+        try:
+            st = os.stat(log_file)
+            if (st.st_ino, st.st_dev) == entry[1:]:
+                return entry[0]
+        except OSError:
+            pass
+        entry[0].close()
+        del _log_handles[key]
+
+    if len(_log_handles) >= _MAX_LOG_HANDLES:
+        _log_handles.pop(next(iter(_log_handles)))[0].close()
     work_dir.mkdir(parents=True, exist_ok=True)
+    fh = log_file.open("a", encoding="utf-8", buffering=1)
+    st = os.fstat(fh.fileno())
+    _log_handles[key] = (fh, st.st_ino, st.st_dev)
+    return fh
+
+
+def log(msg: str, log_file: Path, work_dir: Path) -> None:
+    """Log message to file and stdout.
+
+    The file handle stays open (line-buffered) between calls, so work_dir
+    is created and the file opened only on the first line.
+    """
     ts = time.strftime("%H:%M:%S")
     line = f"[{ts}] {msg}"
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    with _LOG_LOCK:
+        _log_handle(log_file, work_dir).write(line + "\n")
     logger.info(msg)
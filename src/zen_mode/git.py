@@ -9,6 +9,7 @@ returning sensible defaults (False, None, [], empty stats).
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 import time
 from dataclasses import dataclass
@@ -27,8 +28,39 @@ _GIT_ERRORS = (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError)
 # -----------------------------------------------------------------------------
 # Repository State
 # -----------------------------------------------------------------------------
+# Roots already confirmed as repositories. Only positive answers are kept:
+# a directory can become a repo mid-process (git init) far more plausibly
+# than stop being one, and judge/diff/changed-files each re-ask.
+_known_repos: Set[str] = set()
+
+
+def _has_git_dir(root: str) -> bool:
+    """Check for a usable .git at root: a directory or a gitdir: file with a HEAD."""
+    dot_git = os.path.join(root, ".git")
+    if os.path.isfile(dot_git):
+        # Worktrees and submodules: ".git" is a file pointing at the real dir
+        try:
+            with open(dot_git, encoding="utf-8") as f:
+                first = f.readline().strip()
+        except (OSError, UnicodeDecodeError):
+            return False
+        if not first.startswith("gitdir:"):
+            return False
+        dot_git = os.path.join(root, first[len("gitdir:"):].strip())
+    return os.path.isfile(os.path.join(dot_git, "HEAD"))
+
+
 def is_repo(project_root: Path) -> bool:
     """Check if path is inside a git repository."""
+    key = str(project_root)
+    if key in _known_repos:
+        return True
+    # Common case: the project root is the repo root. Subdirectories,
+    # unusual layouts and anything that only looks like a .git fall
+    # through to git itself.
+    if _has_git_dir(key):
+        _known_repos.add(key)
+        return True
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--is-inside-work-tree"],
@@ -36,10 +68,13 @@ def is_repo(project_root: Path) -> bool:
             cwd=project_root,
             timeout=5
         )
-        return result.returncode == 0
     except _GIT_ERRORS as e:
         _logger.debug("is_repo check failed: %s", e)
         return False
+    if result.returncode != 0:
+        return False
+    _known_repos.add(key)
+    return True
 
 
 def get_repo_root(project_root: Path) -> Optional[Path]:
@@ -82,6 +117,33 @@ def has_head(project_root: Path) -> bool:
         return False
 
 
+def _repo_and_head(project_root: Path) -> Tuple[bool, bool]:
+    """Check is_repo() and has_head() with a single git process.
+
+    --is-inside-work-tree prints true/false in any repository; --verify HEAD
+    then sets the exit code, so one rev-parse answers both questions.
+
+    Returns:
+        Tuple of (is_repo, has_head)
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--is-inside-work-tree", "--verify", "-q", "HEAD"],
+            capture_output=True,
+            text=True, encoding='utf-8', errors='replace',
+            cwd=project_root,
+            timeout=5
+        )
+    except _GIT_ERRORS as e:
+        _logger.debug("repo/HEAD check failed: %s", e)
+        return False, False
+    first = result.stdout.split("\n", 1)[0].strip()
+    in_repo = result.returncode == 0 or first in ("true", "false")
+    if in_repo:
+        _known_repos.add(str(project_root))
+    return in_repo, result.returncode == 0
+
+
 def get_head_commit(project_root: Path) -> Optional[str]:
     """Get current HEAD commit hash, or None if no commits."""
     try:
@@ -224,11 +286,12 @@ def get_diff_stats(project_root: Path) -> DiffStats:
     """
     stats = DiffStats()
 
-    if not is_repo(project_root):
+    in_repo, head_exists = _repo_and_head(project_root)
+    if not in_repo:
         return stats
 
     try:
-        if has_head(project_root):
+        if head_exists:
             result = subprocess.run(
                 ["git", "diff", "--numstat", "HEAD"],
                 capture_output=True,
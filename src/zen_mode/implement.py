@@ -3,16 +3,19 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 import re
+import stat
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
 from zen_mode import git, linter
-from zen_mode.claude import run_claude
+from zen_mode.claude import last_line, run_claude
 from zen_mode.config import (
     MODEL_BRAIN,
     MODEL_EYES,
@@ -20,19 +23,60 @@ from zen_mode.config import (
     TIMEOUT_EXEC,
     TIMEOUT_LINTER,
     MAX_RETRIES,
+    MAX_PARALLEL_STEPS,
+    MAX_BATCH_STEPS,
+    ESCALATE_ON_REPEAT,
 )
 from zen_mode.context import Context
 from zen_mode.exceptions import ImplementError
 from zen_mode.files import backup_file, get_full_constitution, log
-from zen_mode.plan import parse_steps, get_completed_steps
+from zen_mode.plan import parse_steps, parse_step_files, get_completed_steps
+
+# Pre-compiled regex patterns
+_BACKTICK_FILE_PATTERN = re.compile(r"`([^`]+\.\w+)`")
+_GOAL_PATTERN = re.compile(r'\*\*Goal:\*\*\s*(.+?)(?:\n|$)')
+_BATCH_MARKER_PATTERN = re.compile(r"STEP_(COMPLETE|BLOCKED):\s*(\d+)")
+_VERIFY_STEP_PATTERN = re.compile(r"verify|test|check|validate|confirm", re.IGNORECASE)
+
+# Concurrent copies when backing up scout-targeted files
+_BACKUP_WORKERS = 8
 
 
 # -----------------------------------------------------------------------------
 # Linter Integration
 # -----------------------------------------------------------------------------
+# Passing lint results keyed by the stat signature of the files linted
+_lint_pass_cache: Dict[Tuple[Tuple[str, int, int, int], ...], str] = {}
+_lint_pass_cache_lock = threading.Lock()
+_LINT_PASS_CACHE_MAX = 32
+
+
+def _lint_signature(paths: List[str]) -> Optional[Tuple[Tuple[str, int, int, int], ...]]:
+    """Build a (path, inode, mtime_ns, size) signature for a set of files.
+
+    Returns None when the result can't be cached: no paths (the linter falls
+    back to scanning cwd) or any path that isn't an existing regular file.
+    """
+    if not paths:
+        return None
+    signature = []
+    for path in sorted(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        signature.append((path, st.st_ino, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
 def run_linter_with_timeout(timeout: Optional[int] = None, paths: Optional[List[str]] = None) -> Tuple[bool, str]:
     """Run the linter with timeout.
 
+    A passing result is reused without re-linting while none of the linted
+    files has changed (same inode, mtime and size).
+
     Args:
         timeout: Timeout in seconds (default from config)
         paths: Files to lint (default: git changed files)
@@ -47,6 +91,19 @@ def run_linter_with_timeout(timeout: Optional[int] = None, paths: Optional[List[
     if paths is None:
         paths = git.get_changed_files(Path.cwd())
 
+    # Docs/data-only change sets: nothing the linter would scan
+    if paths:
+        paths = [p for p in paths if linter.is_lintable(p)]
+        if not paths:
+            return True, linter.format_report([], "text")[0]
+
+    signature = _lint_signature(paths)
+    if signature is not None:
+        with _lint_pass_cache_lock:
+            cached = _lint_pass_cache.get(signature)
+        if cached is not None:
+            return True, cached
+
     def target():
         result[0], result[1] = linter.run_lint(paths=paths)
 
@@ -57,6 +114,11 @@ def run_linter_with_timeout(timeout: Optional[int] = None, paths: Optional[List[
     if thread.is_alive():
         return False, f"Linter timed out after {timeout}s"
 
+    if result[0] and signature is not None:
+        with _lint_pass_cache_lock:
+            if len(_lint_pass_cache) >= _LINT_PASS_CACHE_MAX:
+                _lint_pass_cache.clear()
+            _lint_pass_cache[signature] = result[1]
     return result[0], result[1]
 
 
@@ -66,6 +128,8 @@ def run_linter_with_timeout(timeout: Optional[int] = None, paths: Optional[List[
 def backup_scout_files_ctx(ctx: Context) -> None:
     """Backup files identified in scout phase before modification.
 
+    Copies are independent I/O, so they run on a small thread pool.
+
     Args:
         ctx: Execution context
     """
@@ -73,16 +137,22 @@ def backup_scout_files_ctx(ctx: Context) -> None:
     if not scout:
         return
 
-    file_pattern = re.compile(r"`([^`]+\.\w+)`")
-    for match in file_pattern.finditer(scout):
+    paths: List[Path] = []
+    seen: Set[Path] = set()
+    for match in _BACKTICK_FILE_PATTERN.finditer(scout):
         filepath = ctx.project_root / match.group(1)
-        if filepath.exists() and filepath.is_file():
-            backup_file(
-                filepath,
-                ctx.backup_dir,
-                ctx.project_root,
-                log_fn=ctx.log
-            )
+        if filepath not in seen and filepath.is_file():
+            seen.add(filepath)
+            paths.append(filepath)
+    if not paths:
+        return
+
+    def _backup(filepath: Path) -> None:
+        backup_file(filepath, ctx.backup_dir, ctx.project_root, log_fn=ctx.log)
+
+    with ThreadPoolExecutor(max_workers=min(_BACKUP_WORKERS, len(paths))) as executor:
+        # list() re-raises the first copy error, as the serial loop did
+        list(executor.map(_backup, paths))
 
 
 # -----------------------------------------------------------------------------
@@ -94,7 +164,7 @@ def extract_plan_goal(plan: str) -> str:
     Plans follow format: **Goal:** [description]
     Returns the goal text or a fallback.
     """
-    match = re.search(r'\*\*Goal:\*\*\s*(.+?)(?:\n|$)', plan)
+    match = _GOAL_PATTERN.search(plan)
     if match:
         return match.group(1).strip()
     # Fallback: first non-empty line after header
@@ -313,6 +383,69 @@ Do not create, modify, or delete any files outside this scope.
     return base
 
 
+def build_batch_prompt(batch_steps: List[Tuple[int, str]], plan: str,
+                       project_root: Path, allowed_files: Optional[str] = None,
+                       goal: Optional[str] = None) -> str:
+    """Build prompt for several consecutive steps done in one session.
+
+    Args:
+        batch_steps: (step_num, step_desc) pairs, in plan order
+        plan: Full plan text
+        project_root: Project root path
+        allowed_files: Optional glob pattern for allowed files
+        goal: Extracted goal from plan
+    """
+    constitution = get_full_constitution(project_root, "GOLDEN RULES", "CODE STYLE", "TESTING")
+    step_list = "\n".join(f"Step {num}: {desc}" for num, desc in batch_steps)
+    first, last = batch_steps[0][0], batch_steps[-1][0]
+    goal_text = goal or "Complete the implementation"
+
+    prompt = f"""<task>
+Execute Steps {first}-{last} of the plan, in order:
+{step_list}
+</task>
+
+<context>
+Goal: {goal_text}
+
+Full plan:
+{plan}
+
+READ target files first to understand current state before editing.
+</context>
+
+<constitution>
+{constitution}
+</constitution>
+
+<instructions>
+Do the steps one at a time, in the order listed. Do not start a step
+before the previous one is done. Only do the steps listed above.
+
+After finishing each step, output on its own line:
+STEP_COMPLETE: <step number>
+
+If a step cannot be done, output STEP_BLOCKED: <step number> <reason>
+and stop without starting the remaining steps.
+</instructions>
+
+<output>
+End with: STEP_COMPLETE: {last} or STEP_BLOCKED: <step number> <reason>
+</output>"""
+
+    if allowed_files:
+        prompt += f"""
+
+<SCOPE>
+You MUST ONLY modify files matching this glob pattern:
+{allowed_files}
+
+Do not create, modify, or delete any files outside this scope.
+</SCOPE>"""
+
+    return prompt
+
+
 def build_escalation_suffix(attempt: int, last_error: str) -> str:
     """Build escalation suffix for final retry."""
     return f"""
@@ -332,9 +465,321 @@ Response: Added `-> dict` return type to `process_data`, done
 </ESCALATION_EXAMPLES>"""
 
 
+# -----------------------------------------------------------------------------
+# Step Scheduling
+# -----------------------------------------------------------------------------
+def group_step_waves(steps: List[Tuple[int, str]], pending: List[int],
+                     step_files: Dict[int, Set[str]],
+                     max_parallel: int) -> List[List[int]]:
+    """Group pending steps into waves that can run concurrently.
+
+    Consecutive steps join the current wave while their declared files are
+    disjoint from every other step in it. Steps without declared files and
+    the final (verification) step always run alone, preserving plan order
+    wherever dependencies are unknown.
+
+    Args:
+        steps: All parsed plan steps
+        pending: Indices into ``steps`` that still need to run, in order
+        step_files: Step number -> declared files (from parse_step_files)
+        max_parallel: Maximum steps per wave (1 = fully serial)
+
+    Returns:
+        List of waves, each a list of step indices
+    """
+    waves: List[List[int]] = []
+    wave_files: Set[str] = set()
+    last_idx = len(steps) - 1
+    for idx in pending:
+        files = step_files.get(steps[idx][0])
+        joinable = (
+            max_parallel > 1
+            and files is not None
+            and idx != last_idx
+            and waves
+            and len(waves[-1]) < max_parallel
+            and steps[waves[-1][-1]][0] in step_files
+            and not (files & wave_files)
+        )
+        if joinable:
+            waves[-1].append(idx)
+            wave_files |= files
+        else:
+            waves.append([idx])
+            wave_files = set(files or ())
+    return waves
+
+
+def group_step_batches(steps: List[Tuple[int, str]], pending: List[int],
+                       max_batch: int) -> List[List[int]]:
+    """Group pending steps into runs to hand to Claude in a single call.
+
+    A batch is a run of adjacent plan steps, all pending, capped at
+    max_batch. The final (verification) step always stands alone.
+
+    Args:
+        steps: All parsed plan steps
+        pending: Indices into ``steps`` that still need to run, in order
+        max_batch: Maximum steps per batch (1 = no batching)
+
+    Returns:
+        List of batches, each a list of step indices
+    """
+    batches: List[List[int]] = []
+    last_idx = len(steps) - 1
+    for idx in pending:
+        joinable = (
+            max_batch > 1
+            and idx != last_idx
+            and batches
+            and len(batches[-1]) < max_batch
+            and batches[-1][-1] == idx - 1
+        )
+        if joinable:
+            batches[-1].append(idx)
+        else:
+            batches.append([idx])
+    return batches
+
+
 # -----------------------------------------------------------------------------
 # Implement Phase (Context-based API)
 # -----------------------------------------------------------------------------
+def _execute_step(ctx: Context, steps: List[Tuple[int, str]], step_idx: int,
+                  plan: str, goal: str, is_verify_only: bool,
+                  allowed_files: Optional[str], fast_track: bool,
+                  lint_paths: Optional[List[str]] = None,
+                  parallel: bool = False) -> int:
+    """Run one plan step through the retry/escalation loop.
+
+    Args:
+        ctx: Execution context
+        steps: All parsed plan steps
+        step_idx: Index of the step to run within ``steps``
+        plan: Full plan content
+        goal: Plan goal extracted for lean prompts
+        is_verify_only: True for verification-only plans
+        allowed_files: Optional glob pattern restricting file modifications
+        fast_track: If True, use MODEL_EYES for the first attempt
+        lint_paths: Files to lint after completion (default: git changed files)
+        parallel: True when sibling steps run concurrently
+
+    Returns:
+        Attempt number on which the step succeeded
+
+    Raises:
+        ImplementError: If the step is blocked or exhausts its retries
+    """
+    step_num, step_desc = steps[step_idx]
+    # Parallel steps use a distinct marker so get_completed_steps' "steps before
+    # the last started one are done" heuristic can't skip an unfinished sibling.
+    marker = f"[STEP {step_num}, parallel]" if parallel else f"[STEP {step_num}]"
+    ctx.log( f"\n{marker} {step_desc[:60]}...")
+    seen_lint_hashes: Set[bytes] = set()
+    lint_feedback = ""
+    # Set when the last attempt completed but lint came back with the same
+    # feedback it was given; only then is an identical prompt worth skipping
+    lint_repeated = False
+    last_prompt_hash = b""
+
+    # Build step context for lean prompts
+    step_context = get_step_context(steps, step_idx)
+
+    # First attempt uses lean context; retries/escalation get full plan
+    use_full_plan = False
+    last_error_summary = ""
+    # Set when lint repeats an earlier failure and ESCALATE_ON_REPEAT is on:
+    # further same-model retries are likely to thrash, so go straight to Opus
+    escalate_now = False
+    attempt = 0
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        escalating = attempt == MAX_RETRIES or escalate_now
+        if attempt > 1:
+            ctx.log( f"  Retry {attempt}/{MAX_RETRIES}...")
+            use_full_plan = True  # Retries get full context
+
+        if escalating:
+            ctx.log( f"  Escalating to {MODEL_BRAIN}...")
+            use_full_plan = True  # Escalation always gets full context
+            model = MODEL_BRAIN
+        else:
+            # Fast track uses Haiku for first attempts, Sonnet for retries
+            model = MODEL_EYES if (fast_track and attempt == 1) else MODEL_HANDS
+
+        # Build prompt with appropriate context level
+        if is_verify_only:
+            base_prompt = build_verify_prompt(step_desc, plan, goal=goal,
+                                              include_full_plan=use_full_plan)
+        elif fast_track and attempt == 1:
+            # Simple prompt for Haiku fast track - be explicit about using Edit tool
+            base_prompt = build_fast_track_prompt(step_desc, plan)
+        else:
+            base_prompt = build_implement_prompt(
+                step_num, step_desc, plan, ctx.project_root, allowed_files,
+                step_context=step_context, goal=goal,
+                include_full_plan=use_full_plan
+            )
+
+        if escalating:
+            prompt = base_prompt + build_escalation_suffix(attempt, last_error_summary)
+        else:
+            prompt = base_prompt + lint_feedback
+
+        # Re-sending a byte-identical prompt after an unchanged lint failure
+        # would just repeat the last attempt
+        prompt_hash = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        if lint_repeated and prompt_hash == last_prompt_hash:
+            ctx.log( f"[SKIP] Step {step_num}: identical retry prompt")
+            continue
+        last_prompt_hash = prompt_hash
+        lint_repeated = False
+
+        output = run_claude(
+            prompt,
+            model=model,
+            phase="implement",
+            timeout=TIMEOUT_EXEC,
+            project_root=ctx.project_root,
+            log_fn=ctx.log,
+            cost_callback=ctx.record_cost,
+            stop_markers=("STEP_COMPLETE", "STEP_BLOCKED"),
+        ) or ""
+
+        final_line = last_line(output)
+        if final_line.startswith("STEP_BLOCKED"):
+            ctx.log( f"[BLOCKED] Step {step_num}")
+            logger.info(f"\n{output}")
+            raise ImplementError(
+                f"Step {step_num} blocked: {final_line}\n"
+                f"  Step description: {step_desc[:100]}\n"
+                f"  Model: {model}, Attempt: {attempt}/{MAX_RETRIES}\n"
+                f"  Log file: {ctx.log_file}"
+            )
+
+        if "STEP_COMPLETE" in output:
+            passed, lint_out = run_linter_with_timeout(paths=lint_paths)
+            if not passed:
+                ctx.log( f"[LINT FAIL] Step {step_num}")
+                lint_lines = lint_out.splitlines()
+                for line in lint_lines[:20]:
+                    logger.info(f"    {line}")
+
+                truncated = "\n".join(lint_lines[:30])
+                last_error_summary = truncated[:300]
+
+                previous_feedback = lint_feedback
+                lint_hash = hashlib.blake2b(lint_out.encode("utf-8", "replace"), digest_size=16).digest()
+                if lint_hash in seen_lint_hashes:
+                    lint_feedback = f"\n\nLINT FAILED (same as a previous attempt—try a different fix):\n{truncated}"
+                    escalate_now = ESCALATE_ON_REPEAT
+                else:
+                    lint_feedback = f"\n\nLINT FAILED:\n{truncated}\n\nFix the issues above."
+                seen_lint_hashes.add(lint_hash)
+                lint_repeated = lint_feedback == previous_feedback
+
+                if len(seen_lint_hashes) >= MAX_RETRIES + 1:
+                    ctx.log( f"[FAILED] Step {step_num}: {len(seen_lint_hashes)} distinct lint failures")
+                    if ctx.backup_dir.exists():
+                        ctx.log( f"[RECOVERY] Backups available in: {ctx.backup_dir}")
+                    raise ImplementError(
+                        f"Step {step_num} failed: {len(seen_lint_hashes)} distinct lint failures\n"
+                        f"  Step description: {step_desc[:100]}\n"
+                        f"  Last lint error (truncated): {last_error_summary[:200]}\n"
+                        f"  Backup dir: {ctx.backup_dir}\n"
+                        f"  Log file: {ctx.log_file}"
+                    )
+                if escalating:
+                    break
+                continue
+
+            ctx.log( f"[COMPLETE] Step {step_num}")
+            return attempt
+        else:
+            # Model didn't signal completion - log what we got for debugging
+            ctx.log(f"[NO_COMPLETE] Step {step_num} - {model} did not signal STEP_COMPLETE")
+            last_error_summary = output[:200] if output else "Empty response"
+            # Log first few lines to help debug
+            if output:
+                for line in output.splitlines()[:3]:
+                    logger.info(f"    {line[:100]}")
+            if escalating:
+                break
+
+    ctx.log( f"[FAILED] Step {step_num} after {attempt} attempts")
+    if ctx.backup_dir.exists():
+        ctx.log( f"[RECOVERY] Backups available in: {ctx.backup_dir}")
+    raise ImplementError(
+        f"Step {step_num} failed after {attempt} attempts\n"
+        f"  Step description: {step_desc[:100]}\n"
+        f"  Last error: {last_error_summary[:200] if last_error_summary else 'No output'}\n"
+        f"  Backup dir: {ctx.backup_dir}\n"
+        f"  Log file: {ctx.log_file}"
+    )
+
+
+def _execute_batch(ctx: Context, steps: List[Tuple[int, str]], batch: List[int],
+                   plan: str, goal: str, allowed_files: Optional[str]) -> int:
+    """Run several consecutive steps in one Claude call.
+
+    Only the leading steps the model marks STEP_COMPLETE, in order, count as
+    done, and only if the lint of the result passes. Batch steps are not
+    logged as started, so anything left over is picked up by the regular
+    single-step loop, which has the retries and escalation. Edits made by
+    the batch are not rolled back; those retries start from them.
+
+    Returns:
+        Number of leading steps of ``batch`` that completed
+    """
+    nums = [steps[i][0] for i in batch]
+    ctx.log( f"\n[BATCH] Steps {', '.join(str(n) for n in nums)}")
+
+    prompt = build_batch_prompt([steps[i] for i in batch], plan, ctx.project_root,
+                                allowed_files, goal=goal)
+    # The response is only the final message; per-step markers emitted
+    # earlier in the session arrive through the streamed message texts
+    texts: List[str] = []
+    output = run_claude(
+        prompt,
+        model=MODEL_HANDS,
+        phase="implement",
+        timeout=TIMEOUT_EXEC * len(batch),
+        project_root=ctx.project_root,
+        log_fn=ctx.log,
+        cost_callback=ctx.record_cost,
+        # Per-step markers appear mid-session; only the last one ends it
+        stop_markers=(f"STEP_COMPLETE: {nums[-1]}", "STEP_BLOCKED"),
+        text_callback=texts.append,
+    ) or ""
+    texts.append(output)
+
+    status = {
+        int(num): kind
+        for text in texts
+        for kind, num in _BATCH_MARKER_PATTERN.findall(text)
+    }
+    done = 0
+    while done < len(nums) and status.get(nums[done]) == "COMPLETE":
+        done += 1
+
+    if done:
+        passed, lint_out = run_linter_with_timeout()
+        if not passed:
+            ctx.log( "[LINT FAIL] Batch, retrying as single steps")
+            ctx.log( f"  → The working tree already contains the batch's edits for "
+                     f"Steps {', '.join(str(n) for n in nums[:done])}; "
+                     f"single-step retries build on them")
+            for line in lint_out.splitlines()[:20]:
+                logger.info(f"    {line}")
+            return 0
+        for num in nums[:done]:
+            ctx.log( f"[COMPLETE] Step {num}")
+
+    if done < len(nums):
+        ctx.log( f"[BATCH] Continuing from Step {nums[done]} one step at a time")
+    return done
+
+
 def phase_implement_ctx(ctx: Context, allowed_files: Optional[str] = None,
                         fast_track: bool = False) -> None:
     """Execute implement phase using Context object.
@@ -344,7 +789,7 @@ def phase_implement_ctx(ctx: Context, allowed_files: Optional[str] = None,
         allowed_files: Optional glob pattern restricting file modifications
         fast_track: If True, use MODEL_EYES (Haiku) for first attempts instead of MODEL_HANDS
     """
-    plan = ctx.plan_file.read_text(encoding="utf-8")
+    plan = ctx.read_plan()
     steps = parse_steps(plan)
 
     if not steps:
@@ -355,150 +800,54 @@ def phase_implement_ctx(ctx: Context, allowed_files: Optional[str] = None,
     goal = extract_plan_goal(plan)
 
     # Check that plan includes a verification step
-    last_step_desc = steps[-1][1].lower() if steps else ""
-    verify_keywords = ['verify', 'test', 'check', 'validate', 'confirm']
-    has_verify_step = any(kw in last_step_desc for kw in verify_keywords)
-    if not has_verify_step:
+    if not _VERIFY_STEP_PATTERN.search(steps[-1][1]):
         ctx.log( "[WARN] Plan missing verification step. Adding implicit verify.")
 
     backup_scout_files_ctx(ctx)
 
     ctx.log( f"\n[IMPLEMENT] {len(steps)} steps to execute.")
     completed = get_completed_steps(ctx.log_file)
-    seen_lint_hashes: Set[str] = set()
+    is_verify_only = "OPERATION: VERIFY_COMPLETE" in plan
+    step_files = parse_step_files(plan) if MAX_PARALLEL_STEPS > 1 else {}
+    pending = [i for i, (num, _) in enumerate(steps) if num not in completed]
     consecutive_retry_steps = 0
 
-    for step_idx, (step_num, step_desc) in enumerate(steps):
-        if step_num in completed:
-            continue
-
-        ctx.log( f"\n[STEP {step_num}] {step_desc[:60]}...")
-
-        is_verify_only = "OPERATION: VERIFY_COMPLETE" in plan
-
-        # Build step context for lean prompts
-        step_context = get_step_context(steps, step_idx)
-
-        # First attempt uses lean context; retries/escalation get full plan
-        use_full_plan = False
-        last_error_summary = ""
-        step_succeeded_on_attempt = 1
-
-        for attempt in range(1, MAX_RETRIES + 1):
-            if attempt > 1:
-                ctx.log( f"  Retry {attempt}/{MAX_RETRIES}...")
-                use_full_plan = True  # Retries get full context
-
-            if attempt == MAX_RETRIES:
-                ctx.log( f"  Escalating to {MODEL_BRAIN}...")
-                use_full_plan = True  # Escalation always gets full context
-                model = MODEL_BRAIN
-            else:
-                # Fast track uses Haiku for first attempts, Sonnet for retries
-                model = MODEL_EYES if (fast_track and attempt == 1) else MODEL_HANDS
-
-            # Build prompt with appropriate context level
-            if is_verify_only:
-                base_prompt = build_verify_prompt(step_desc, plan, goal=goal,
-                                                  include_full_plan=use_full_plan)
-            elif fast_track and attempt == 1:
-                # Simple prompt for Haiku fast track - be explicit about using Edit tool
-                base_prompt = build_fast_track_prompt(step_desc, plan)
-            else:
-                base_prompt = build_implement_prompt(
-                    step_num, step_desc, plan, ctx.project_root, allowed_files,
-                    step_context=step_context, goal=goal,
-                    include_full_plan=use_full_plan
-                )
-
-            prompt = base_prompt
-            if attempt == MAX_RETRIES:
-                prompt = base_prompt + build_escalation_suffix(attempt, last_error_summary)
-
-            output = run_claude(
-                prompt,
-                model=model,
-                phase="implement",
-                timeout=TIMEOUT_EXEC,
-                project_root=ctx.project_root,
-                log_fn=ctx.log,
-                cost_callback=ctx.record_cost,
-            ) or ""
-
-            last_line = output.strip().split('\n')[-1] if output.strip() else ""
-            if last_line.startswith("STEP_BLOCKED"):
-                ctx.log( f"[BLOCKED] Step {step_num}")
-                logger.info(f"\n{output}")
-                raise ImplementError(
-                    f"Step {step_num} blocked: {last_line}\n"
-                    f"  Step description: {step_desc[:100]}\n"
-                    f"  Model: {model}, Attempt: {attempt}/{MAX_RETRIES}\n"
-                    f"  Log file: {ctx.log_file}"
-                )
-
-            if "STEP_COMPLETE" in output:
-                passed, lint_out = run_linter_with_timeout()
-                if not passed:
-                    ctx.log( f"[LINT FAIL] Step {step_num}")
-                    for line in lint_out.splitlines()[:20]:
-                        logger.info(f"    {line}")
-
-                    truncated = "\n".join(lint_out.splitlines()[:30])
-                    last_error_summary = truncated[:300]
-
-                    lint_hash = hashlib.md5(lint_out.encode()).hexdigest()
-                    if lint_hash in seen_lint_hashes:
-                        prompt += f"\n\nLINT FAILED (same as a previous attempt—try a different fix):\n{truncated}"
-                    else:
-                        prompt += f"\n\nLINT FAILED:\n{truncated}\n\nFix the issues above."
-                    seen_lint_hashes.add(lint_hash)
-
-                    if len(seen_lint_hashes) >= MAX_RETRIES + 1:
-                        ctx.log( f"[FAILED] Step {step_num}: {len(seen_lint_hashes)} distinct lint failures")
-                        if ctx.backup_dir.exists():
-                            ctx.log( f"[RECOVERY] Backups available in: {ctx.backup_dir}")
-                        raise ImplementError(
-                            f"Step {step_num} failed: {len(seen_lint_hashes)} distinct lint failures\n"
-                            f"  Step description: {step_desc[:100]}\n"
-                            f"  Last lint error (truncated): {last_error_summary[:200]}\n"
-                            f"  Backup dir: {ctx.backup_dir}\n"
-                            f"  Log file: {ctx.log_file}"
-                        )
-                    continue
-
-                ctx.log( f"[COMPLETE] Step {step_num}")
-                seen_lint_hashes.clear()
-                step_succeeded_on_attempt = attempt
+    if MAX_BATCH_STEPS > 1 and not fast_track and not is_verify_only:
+        # Batch while batches fully succeed; from the first miss (or the
+        # first step that can't be batched) on, run step by step in order
+        for batch in group_step_batches(steps, pending, MAX_BATCH_STEPS):
+            if len(batch) == 1:
+                break
+            done = _execute_batch(ctx, steps, batch, plan, goal, allowed_files)
+            pending = pending[pending.index(batch[0]) + done:]
+            if done < len(batch):
                 break
-            else:
-                # Model didn't signal completion - log what we got for debugging
-                ctx.log(f"[NO_COMPLETE] Step {step_num} - {model} did not signal STEP_COMPLETE")
-                last_error_summary = output[:200] if output else "Empty response"
-                # Log first few lines to help debug
-                if output:
-                    for line in output.splitlines()[:3]:
-                        logger.info(f"    {line[:100]}")
-        else:
-            ctx.log( f"[FAILED] Step {step_num} after {MAX_RETRIES} attempts")
-            if ctx.backup_dir.exists():
-                ctx.log( f"[RECOVERY] Backups available in: {ctx.backup_dir}")
-            raise ImplementError(
-                f"Step {step_num} failed after {MAX_RETRIES} attempts\n"
-                f"  Step description: {step_desc[:100]}\n"
-                f"  Last error: {last_error_summary[:200] if last_error_summary else 'No output'}\n"
-                f"  Backup dir: {ctx.backup_dir}\n"
-                f"  Log file: {ctx.log_file}"
-            )
 
-        if step_succeeded_on_attempt > 1:
-            consecutive_retry_steps += 1
-            if consecutive_retry_steps >= 2:
-                ctx.log( "[CHECKPOINT] Multiple consecutive steps needed retries.")
-                ctx.log( "  → Something may be wrong with the plan.")
-                ctx.log( "  → Review .zen/log.md and consider --reset if plan needs rework.")
+    for wave in group_step_waves(steps, pending, step_files, MAX_PARALLEL_STEPS):
+        if len(wave) == 1:
+            attempts = [_execute_step(ctx, steps, wave[0], plan, goal, is_verify_only,
+                                      allowed_files, fast_track)]
         else:
-            consecutive_retry_steps = 0
-
-
-
-
+            nums = ", ".join(str(steps[i][0]) for i in wave)
+            ctx.log( f"\n[PARALLEL] Steps {nums} (disjoint files)")
+            with ThreadPoolExecutor(max_workers=len(wave)) as executor:
+                futures = [
+                    executor.submit(
+                        _execute_step, ctx, steps, i, plan, goal, is_verify_only,
+                        allowed_files, fast_track,
+                        lint_paths=sorted(str(ctx.project_root / f) for f in step_files[steps[i][0]]),
+                        parallel=True,
+                    )
+                    for i in wave
+                ]
+                attempts = [f.result() for f in futures]
+
+        for step_succeeded_on_attempt in attempts:
+            if step_succeeded_on_attempt > 1:
+                consecutive_retry_steps += 1
+                if consecutive_retry_steps >= 2:
+                    ctx.log( "[CHECKPOINT] Multiple consecutive steps needed retries.")
+                    ctx.log( "  → Something may be wrong with the plan.")
+                    ctx.log( "  → Review .zen/log.md and consider --reset if plan needs rework.")
+            else:
+                consecutive_retry_steps = 0
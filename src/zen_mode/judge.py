@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import sys
 from pathlib import Path
 from typing import Callable, List, Optional
@@ -27,6 +28,10 @@ from zen_mode.plan import parse_steps
 from zen_mode.verify import VerifyState, phase_verify
 
 
+# Rule B: paths that always get a review
+_RISKY_PATH_PATTERN = re.compile(r"auth|login|secur|payment|crypt|secret|token", re.IGNORECASE)
+
+
 def _is_test_or_doc(path: str) -> bool:
     """Check if path is a test or documentation file."""
     return (path.endswith(('.md', '.txt', '.rst')) or
@@ -131,9 +136,18 @@ def should_skip_judge_ctx(ctx: Context, log_fn: Optional[Callable[[str], None]]
     if not git.is_repo(ctx.project_root):
         return False  # Fail-safe: require judge if not a git repo
 
-    # Get diff stats and untracked files
-    stats = git.get_diff_stats(ctx.project_root)
+    # Rule B for new files first: a sensitive new code file forces review,
+    # so the numstat diff is not needed at all.
     untracked_files = git.get_untracked_files(ctx.project_root)
+    risky = next(
+        (f for f in untracked_files if _RISKY_PATH_PATTERN.search(f) and not _is_test_or_doc(f)),
+        None,
+    )
+    if risky is not None:
+        _log(f"[JUDGE] Required: Sensitive file ({risky})")
+        return False
+
+    stats = git.get_diff_stats(ctx.project_root)
 
     if stats.total == 0 and not untracked_files:
         _log("[JUDGE] Skipping: No changes detected")
@@ -152,11 +166,10 @@ def should_skip_judge_ctx(ctx: Context, log_fn: Optional[Callable[[str], None]]
     has_new_code_files = untracked_files and not all(_is_test_or_doc(f) for f in untracked_files)
 
     # Rule B: Risky files always reviewed
-    risky_patterns = ['auth', 'login', 'secur', 'payment', 'crypt', 'secret', 'token']
-    for f in changed_files:
-        if any(r in f.lower() for r in risky_patterns):
-            _log(f"[JUDGE] Required: Sensitive file ({f})")
-            return False
+    risky = next((f for f in changed_files if _RISKY_PATH_PATTERN.search(f)), None)
+    if risky is not None:
+        _log(f"[JUDGE] Required: Sensitive file ({risky})")
+        return False
 
     # Rule A: Typo fix threshold
     if total_changes < JUDGE_TRIVIAL_LINES and not has_new_code_files:
@@ -169,7 +182,7 @@ def should_skip_judge_ctx(ctx: Context, log_fn: Optional[Callable[[str], None]]
         return True
 
     # Rule D: Small refactor + simple plan
-    plan = ctx.plan_file.read_text(encoding="utf-8")
+    plan = ctx.read_plan()
     steps = parse_steps(plan)
     if len(steps) <= JUDGE_SIMPLE_PLAN_STEPS and total_changes < JUDGE_SIMPLE_PLAN_LINES and not has_new_code_files:
         _log(f"[JUDGE] Skipping: Simple ({len(steps)} steps, {total_changes} lines)")
@@ -194,7 +207,7 @@ def phase_judge_ctx(ctx: Context, non_interactive: bool = False) -> None:
     """
     ctx.log( "\n[JUDGE] Senior Architect review...")
 
-    plan = ctx.plan_file.read_text(encoding="utf-8")
+    plan = ctx.read_plan()
     scout = ctx.scout_file.read_text(encoding="utf-8")
     test_output = ctx.test_output_file.read_text(encoding="utf-8") if ctx.test_output_file.exists() else ""
 
@@ -277,7 +290,7 @@ def phase_judge_ctx(ctx: Context, non_interactive: bool = False) -> None:
 
         ctx.log( f"[JUDGE_REJECTED] Issues found (loop {loop})")
 
-        feedback = output.split("JUDGE_REJECTED", 1)[-1].strip()
+        feedback = output.partition("JUDGE_REJECTED")[2].strip()
         write_file(judge_feedback_file, feedback, ctx.work_dir)
 
         for line in feedback.splitlines()[:10]:
@@ -351,26 +351,32 @@ def _rule_applies_to_ext(rule_name: str, ext: str) -> bool:
     return ext in allowed
 
 
+def is_lintable(path: str) -> bool:
+    """Check, from the path alone, whether check_file would scan it.
+
+    Lets callers skip the linter entirely when a change set is only
+    docs, data or binaries. Content checks (size, binary sniffing) still
+    happen in check_file.
+    """
+    p = Path(path)
+    if p.name == Path(__file__).name or p.name in IGNORE_FILES:
+        return False
+    # Skip files in ignored directories (e.g., node_modules, .git, venv)
+    if any(part in IGNORE_DIRS for part in p.parts):
+        return False
+    # Skip binary files (never lint) and text files with too many false positives
+    suffix = p.suffix.lower()
+    return suffix not in BINARY_EXTS and suffix not in LINT_SKIP_EXTS
+
+
 def check_file(path: str, min_severity: str = "LOW", config: Optional[Dict] = None) -> List[Dict]:
     """Scan a file for violations."""
     p = Path(path)
 
-    if p.name == Path(__file__).name:
-        return []
-
     # Pre-checks
-    if not p.exists() or not p.is_file():
+    if not is_lintable(path):
         return []
-    if p.name in IGNORE_FILES:
-        return []
-    # Skip files in ignored directories (e.g., node_modules, .git, venv)
-    if any(part in IGNORE_DIRS for part in p.parts):
-        return []
-    # Skip binary files (never lint)
-    if p.suffix.lower() in BINARY_EXTS:
-        return []
-    # Skip text files with too many false positives
-    if p.suffix.lower() in LINT_SKIP_EXTS:
+    if not p.exists() or not p.is_file():
         return []
     # Skip large files (> 1MB) to avoid performance issues
     if p.stat().st_size > 1_000_000:
@@ -4,7 +4,7 @@ from __future__ import annotations
 import re
 import sys
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from zen_mode.claude import run_claude
 from zen_mode.config import MODEL_BRAIN
@@ -15,11 +15,16 @@ from zen_mode.files import write_file, get_full_constitution, log
 
 # Pre-compiled regex patterns for step parsing
 _STEP_STRICT_PATTERN = re.compile(r"^## Step (\d+):\s*(.+)$", re.MULTILINE)
-_STEP_FLEXIBLE_PATTERN = re.compile(
-    r"(?:^|\n)(?:#{1,6}\s*)?(?:Step\s+(\d+)|(\d+)\.)[:\s]+(.*?)(?=\n(?:#{1,6}\s*)?(?:Step\s+\d+|\d+\.)|$)",
-    re.DOTALL | re.IGNORECASE,
+# Flexible headers are matched per line; a step's body runs to the next boundary line
+_STEP_FLEXIBLE_HEADER = re.compile(
+    r"(?:#{1,6}[ \t]*)?(?:Step\s+(\d+)|(\d+)\.)(?:[:\s]+(.*))?$", re.IGNORECASE
 )
+_STEP_FLEXIBLE_BOUNDARY = re.compile(r"(?:#{1,6}[ \t]*)?(?:Step\s+\d+|\d+\.)", re.IGNORECASE)
 _BULLET_PATTERN = re.compile(r"(?:^|\n)[-*]\s+(.*?)(?=\n[-*]|$)")
+_FILES_LINE_PATTERN = re.compile(r"^\**Files\**:\**\s*(.+)$", re.MULTILINE | re.IGNORECASE)
+_BACKTICK_PATTERN = re.compile(r"`([^`]+)`")
+_COMPLETE_MARKER_PATTERN = re.compile(r"\[COMPLETE\] Step\s+(\d+)")
+_STEP_STARTED_PATTERN = re.compile(r"\[STEP\s+(\d+)\]")
 
 
 # -----------------------------------------------------------------------------
@@ -128,6 +133,31 @@ Write output to: {plan_file}
 # -----------------------------------------------------------------------------
 # Step Parsing
 # -----------------------------------------------------------------------------
+def _parse_flexible_steps(plan: str) -> List[Tuple[int, str]]:
+    """Parse ``Step N:`` / ``N.`` steps in a single pass over the lines.
+
+    A step's description is its header remainder plus every following line
+    up to the next line that starts like a step header. Lines are matched
+    individually, so long plans can't trigger regex backtracking across the
+    whole document.
+    """
+    steps: List[Tuple[int, str]] = []
+    current: Optional[int] = None
+    body: List[str] = []
+    for line in plan.splitlines():
+        if _STEP_FLEXIBLE_BOUNDARY.match(line):
+            if current is not None:
+                steps.append((current, "\n".join(body)))
+            header = _STEP_FLEXIBLE_HEADER.match(line)
+            current = int(header.group(1) or header.group(2)) if header else None
+            body = [header.group(3) or ""] if header else []
+        elif current is not None:
+            body.append(line)
+    if current is not None:
+        steps.append((current, "\n".join(body)))
+    return steps
+
+
 def parse_steps(plan: str) -> List[Tuple[int, str]]:
     """Parse steps from plan markdown.
 
@@ -149,15 +179,14 @@ def parse_steps(plan: str) -> List[Tuple[int, str]]:
         return result
 
     # Fallback: flexible parsing
-    matches = _STEP_FLEXIBLE_PATTERN.findall(plan + "\n")
+    matches = _parse_flexible_steps(plan)
     if matches:
         seen = set()
         result = []
-        for m in matches:
-            step_num = int(m[0] or m[1])
+        for step_num, desc in matches:
             if step_num not in seen:
                 seen.add(step_num)
-                result.append((step_num, m[2].strip()))
+                result.append((step_num, desc.strip()))
         return result
 
     # Last resort: bullets
@@ -165,6 +194,32 @@ def parse_steps(plan: str) -> List[Tuple[int, str]]:
     return [(i, txt.strip()) for i, txt in enumerate(bullets, 1) if txt.strip()]
 
 
+def parse_step_files(plan: str) -> Dict[int, Set[str]]:
+    """Map step numbers to the files declared on their ``Files:`` line.
+
+    Only strict ``## Step N:`` headers are considered. Steps without a
+    ``Files:`` line (or with no backticked paths on it) are omitted, so
+    callers can treat them as touching an unknown set of files.
+
+    Args:
+        plan: Plan markdown content
+
+    Returns:
+        Dict of step number -> set of declared file paths
+    """
+    headers = list(_STEP_STRICT_PATTERN.finditer(plan))
+    step_files: Dict[int, Set[str]] = {}
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(plan)
+        files_line = _FILES_LINE_PATTERN.search(plan, header.end(), end)
+        if not files_line:
+            continue
+        files = {f.strip() for f in _BACKTICK_PATTERN.findall(files_line.group(1)) if f.strip()}
+        if files:
+            step_files[int(header.group(1))] = files
+    return step_files
+
+
 def validate_plan_efficiency(steps: List[Tuple[int, str]]) -> Tuple[bool, str]:
     """Check plan for common inefficiency patterns. Returns (valid, message)."""
     if not steps:
@@ -239,11 +294,11 @@ def get_completed_steps(log_file: Path) -> Set[int]:
     completed: Set[int] = set()
 
     # Explicit markers
-    for m in re.findall(r"\[COMPLETE\] Step\s+(\d+)", log_content):
+    for m in _COMPLETE_MARKER_PATTERN.findall(log_content):
         completed.add(int(m))
 
     # Heuristic: steps before last started are done
-    started = re.findall(r"\[STEP\s+(\d+)\]", log_content)
+    started = _STEP_STARTED_PATTERN.findall(log_content)
     if started:
         max_started = max(int(m) for m in started)
         for i in range(1, max_started):
@@ -285,7 +340,7 @@ def phase_plan_ctx(ctx: Context) -> None:
             raise PlanError("Plan phase failed - no output from Claude")
         write_file(ctx.plan_file, output, ctx.work_dir)
 
-    plan_content = ctx.plan_file.read_text(encoding="utf-8")
+    plan_content = ctx.read_plan()
     steps = parse_steps(plan_content)
 
     # Validate interface-first structure
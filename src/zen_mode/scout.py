@@ -3,12 +3,16 @@ from __future__ import annotations
 
 import logging
 import re
+import shutil
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
-from typing import Callable, Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from zen_mode.claude import run_claude
 from zen_mode.config import MODEL_EYES
@@ -25,6 +29,10 @@ FILE_SIZE_LARGE = 500    # lines
 FILE_SIZE_MASSIVE = 2000  # lines
 MAX_BYTES_TO_READ = 5_000_000  # 5MB cap
 
+# Pattern: - `path/to/file.py`: description
+_ANNOTATE_LINE_PATTERN = re.compile(r'^(\s*- `)([^`]+)(`:.*)')
+_TARGETED_FILE_PATTERN = re.compile(r"- `([^`]+)`")
+
 
 def count_lines_safe(path: Path, max_bytes: int = MAX_BYTES_TO_READ) -> Optional[int]:
     """Safely count lines in a file.
@@ -37,15 +45,38 @@ def count_lines_safe(path: Path, max_bytes: int = MAX_BYTES_TO_READ) -> Optional
         Line count, or None if file can't be read
     """
     try:
-        if not path.exists() or not path.is_file():
+        st = path.stat()
+        if not stat.S_ISREG(st.st_mode):
             return None
-        if path.stat().st_size > max_bytes:
+        if st.st_size > max_bytes:
             return 9999  # Assume massive
-        return len(path.read_text(errors='ignore').splitlines())
+        return _count_lines_cached(str(path), st.st_ino, st.st_mtime_ns, st.st_size)
     except (OSError, PermissionError):
         return None
 
 
+@lru_cache(maxsize=4096)
+def _count_lines_cached(path_str: str, inode: int, mtime_ns: int, size: int) -> int:
+    """Count lines of a file version; the stat fields key the cache.
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    # Count newline bytes chunk by chunk instead of decoding and splitting
+    count = 0
+    last = b""
+    with open(path_str, "rb") as f:
+        chunk = f.read(1 << 20)
+        if chunk.find(b"\0", 0, 4096) != -1:
+            return 9999  # Binary: no meaningful line count, assume massive
+        while chunk:
+            count += chunk.count(b"\n")
+            last = chunk
+            chunk = f.read(1 << 20)
+    # An unterminated final line still counts
+    return count + 1 if last and not last.endswith(b"\n") else count
+
+
 def file_size_tag(line_count: Optional[int]) -> str:
     """Return size tag based on line count.
 
@@ -85,29 +116,41 @@ def annotate_file_sizes(scout_file: Path, project_root: Path,
         logger.warning(f"Failed to read scout file {scout_file}: {e}")
         return  # Can't annotate if we can't read
 
-    lines = content.splitlines()
-    modified = False
-    annotated_count = 0
+    annotated, annotated_count = _annotate_content(content, project_root)
+    if annotated_count:
+        try:
+            write_file(scout_file, annotated)
+        except OSError as e:
+            logger.error(f"Failed to write annotated scout file: {e}")
+            return  # Don't raise - annotations are nice-to-have, not critical
+        if log_fn:
+            log_fn(f"[SCOUT] Annotated {annotated_count} large files")
+
+
+def _annotate_content(content: str, project_root: Path) -> Tuple[str, int]:
+    """Add size tags to Targeted/Context file entries of scout content.
 
+    Returns:
+        Tuple of (content, number of entries tagged); content is returned
+        unchanged when nothing was tagged
+    """
     # Only annotate in these sections
     annotate_sections = {'## Targeted Files', '## Context Files'}
-    skip_sections = {'## Deletion Candidates', '## Grep Impact', '## Open Questions', '## Triage'}
-
-    # Pattern: - `path/to/file.py`: description
-    file_pattern = re.compile(r'^(\s*- `)([^`]+)(`:.*)')
+    if not any(s in content for s in annotate_sections):
+        return content, 0  # Nothing eligible (e.g. a bare fast-track scout)
 
+    annotated_count = 0
     in_annotate_section = False
     new_lines = []
 
-    for line in lines:
+    for line in content.splitlines():
         # Track which section we're in
         if line.startswith('## '):
-            section_header = line.split('(')[0].strip()  # Handle "## Targeted Files (Must Change)"
             in_annotate_section = any(line.startswith(s) for s in annotate_sections)
 
         # Only process file lines in annotate sections
         if in_annotate_section:
-            match = file_pattern.match(line)
+            match = _ANNOTATE_LINE_PATTERN.match(line)
             if match:
                 prefix, filepath, suffix = match.groups()
                 # Skip if already annotated
@@ -118,19 +161,13 @@ def annotate_file_sizes(scout_file: Path, project_root: Path,
                     if tag:
                         # Insert tag before the colon
                         new_lines.append(f"{prefix}{filepath}`{tag}{suffix[1:]}")
-                        modified = True
                         annotated_count += 1
                         continue
         new_lines.append(line)
 
-    if modified:
-        try:
-            scout_file.write_text('\n'.join(new_lines), encoding='utf-8')
-        except OSError as e:
-            logger.error(f"Failed to write annotated scout file: {e}")
-            return  # Don't raise - annotations are nice-to-have, not critical
-        if log_fn:
-            log_fn(f"[SCOUT] Annotated {annotated_count} large files")
+    if not annotated_count:
+        return content, 0
+    return '\n'.join(new_lines), annotated_count
 
 
 # -----------------------------------------------------------------------------
@@ -155,7 +192,7 @@ def parse_targeted_files(scout_content: str) -> List[str]:
         if line.startswith("## ") and in_section:
             break
         if in_section and line.strip().startswith("- `"):
-            match = re.match(r"- `([^`]+)`", line.strip())
+            match = _TARGETED_FILE_PATTERN.match(line.strip())
             if match:
                 files.append(match.group(1))
 
@@ -165,6 +202,49 @@ def parse_targeted_files(scout_content: str) -> List[str]:
 # -----------------------------------------------------------------------------
 # Grep Impact (Golden Rule Enforcement)
 # -----------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def _ripgrep() -> Optional[str]:
+    """Return the ripgrep executable path, or None if not installed."""
+    return shutil.which("rg")
+
+
+def _rg_files(stems: List[str], globs: List[str], project_root: Path) -> Optional[Set[str]]:
+    """List files containing any stem using ripgrep.
+
+    Stems are passed as fixed strings, so no regex dialect differences
+    with git grep apply. Like git grep, ripgrep honors .gitignore; user
+    config (RIPGREP_CONFIG_PATH) is ignored so it cannot change the output.
+
+    Returns:
+        Matching paths relative to project_root, or None when ripgrep is
+        unavailable or failed (caller falls back to git grep)
+    """
+    rg = _ripgrep()
+    if rg is None:
+        return None
+    cmd = [rg, "--no-config", "-l", "-F"]
+    for stem in stems:
+        cmd.extend(["-e", stem])
+    for glob in globs:
+        cmd.extend(["-g", glob])
+    cmd.append(".")
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            cwd=project_root,
+            timeout=60
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.debug(f"ripgrep failed, falling back to git grep: {e}")
+        return None
+    if result.returncode not in (0, 1):  # 1 = no matches
+        return None
+    # Path drops the leading "./" and as_posix() matches plan-style targets
+    return {Path(f).as_posix() for f in result.stdout.splitlines() if f}
+
+
 def grep_impact(targeted_files: List[str], project_root: Path) -> Dict[str, List[str]]:
     """Find all files that reference the targeted files.
 
@@ -174,7 +254,8 @@ def grep_impact(targeted_files: List[str], project_root: Path) -> Dict[str, List
     - from .module import (relative)
     - from package.module import
 
-    Batches all stems into a single grep call for O(1) subprocess overhead.
+    Batches all stems into a single grep call for O(1) subprocess overhead,
+    using ripgrep when it is installed.
 
     Args:
         targeted_files: List of file paths to check
@@ -204,39 +285,42 @@ def grep_impact(targeted_files: List[str], project_root: Path) -> Dict[str, List
     if not extensions:
         extensions = {".py"}  # Default to Python if no extension
 
-    # Single batched grep call
-    all_matches: Set[str] = set()
-    try:
-        # Build glob patterns for each extension
-        globs = [f"*{ext}" for ext in extensions]
-        cmd = ["git", "grep", "-lE", pattern, "--"] + globs
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=project_root,
-            timeout=60
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            all_matches = set(result.stdout.strip().split("\n"))
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        # git not available, try Unix grep
+    # Build glob patterns for each extension
+    globs = [f"*{ext}" for ext in extensions]
+
+    # Single batched search: ripgrep if installed, else git grep, else grep
+    all_matches = _rg_files(stems, globs, project_root)
+    if all_matches is None:
+        all_matches = set()
         try:
-            # Build --include patterns for each extension
-            include_args = []
-            for ext in extensions:
-                include_args.extend(["--include", f"*{ext}"])
+            cmd = ["git", "grep", "-lE", pattern, "--"] + globs
             result = subprocess.run(
-                ["grep", "-rlE"] + include_args + [pattern, "."],
+                cmd,
                 capture_output=True,
                 text=True,
                 cwd=project_root,
                 timeout=60
             )
             if result.returncode == 0 and result.stdout.strip():
-                all_matches = {f.lstrip("./") for f in result.stdout.strip().split("\n")}
+                all_matches = set(result.stdout.strip().split("\n"))
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+            # git not available, try Unix grep
+            try:
+                # Build --include patterns for each extension
+                include_args = []
+                for glob in globs:
+                    include_args.extend(["--include", glob])
+                result = subprocess.run(
+                    ["grep", "-rlE"] + include_args + [pattern, "."],
+                    capture_output=True,
+                    text=True,
+                    cwd=project_root,
+                    timeout=60
+                )
+                if result.returncode == 0 and result.stdout.strip():
+                    all_matches = {f.lstrip("./") for f in result.stdout.strip().split("\n")}
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                pass
 
     # Map matches back to targets by checking which stems appear in each file
     impact: Dict[str, List[str]] = {t: [] for t in targeted_files}
@@ -287,25 +371,67 @@ def append_grep_impact_to_scout(scout_file: Path, targeted_files: List[str],
         project_root: Project root directory
         log_fn: Optional logging function
     """
+    section = _grep_impact_section(targeted_files, project_root, log_fn)
+    if section:
+        try:
+            with scout_file.open("a", encoding="utf-8") as f:
+                f.write(section)
+        except OSError as e:
+            if log_fn:
+                log_fn(f"[SCOUT] Failed to append grep impact: {e}")
+
+
+def _grep_impact_section(targeted_files: List[str], project_root: Path,
+                         log_fn: Optional[Callable[[str], None]] = None) -> str:
+    """Build the Grep Impact markdown block ("" when there is nothing to add)."""
     if not targeted_files:
-        return
+        return ""
 
     deps = expand_dependencies(targeted_files, project_root)
 
-    if deps:
+    if not deps:
         if log_fn:
-            log_fn(f"[SCOUT] Found {len(deps)} files referencing targeted files")
+            log_fn("[SCOUT] No additional callers/importers found")
+        return ""
 
-        try:
-            with scout_file.open("a", encoding="utf-8") as f:
-                f.write("\n## Grep Impact (callers/importers)\n")
-                for dep in sorted(deps):
-                    f.write(f"- `{dep}`: references targeted file\n")
-        except OSError as e:
-            if log_fn:
-                log_fn(f"[SCOUT] Failed to append grep impact: {e}")
-    elif log_fn:
-        log_fn("[SCOUT] No additional callers/importers found")
+    if log_fn:
+        log_fn(f"[SCOUT] Found {len(deps)} files referencing targeted files")
+    return "\n## Grep Impact (callers/importers)\n" + "".join(
+        f"- `{dep}`: references targeted file\n" for dep in sorted(deps)
+    )
+
+
+def finalize_scout(scout_file: Path, scout_content: str, targeted_files: List[str],
+                   project_root: Path, log_fn: Optional[Callable[[str], None]] = None) -> None:
+    """Annotate file sizes and append grep impact with one write of scout.md.
+
+    Equivalent to annotate_file_sizes() followed by
+    append_grep_impact_to_scout(), without re-reading the file in between.
+
+    Args:
+        scout_file: Path to scout.md
+        scout_content: Current content of scout.md
+        targeted_files: Targeted file paths parsed from scout_content
+        project_root: Project root directory
+        log_fn: Optional logging function
+    """
+    # The grep subprocess and the annotation's file reads overlap
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        section_future = executor.submit(_grep_impact_section, targeted_files, project_root, log_fn)
+        annotated, annotated_count = _annotate_content(scout_content, project_root)
+        section = section_future.result()
+    if not section and not annotated_count:
+        return
+
+    if section and not annotated.endswith("\n"):
+        annotated += "\n"
+    try:
+        write_file(scout_file, annotated + section)
+    except OSError as e:
+        logger.error(f"Failed to write scout post-processing: {e}")
+        return  # Don't raise - impact and annotations are nice-to-have
+    if annotated_count and log_fn:
+        log_fn(f"[SCOUT] Annotated {annotated_count} large files")
 
 
 # -----------------------------------------------------------------------------
@@ -400,16 +526,8 @@ def phase_scout_ctx(ctx: Context) -> None:
     if not ctx.scout_file.exists():
         write_file(ctx.scout_file, output, ctx.work_dir)
 
-    # Golden Rule: grep for callers/importers of targeted files
     scout_content = ctx.scout_file.read_text(encoding="utf-8")
     targeted_files = parse_targeted_files(scout_content)
-    if targeted_files:
-        append_grep_impact_to_scout(
-            ctx.scout_file,
-            targeted_files,
-            ctx.project_root,
-            log_fn=ctx.log
-        )
 
     # Capture lint baseline for ratchet model (allow pre-existing violations)
     if targeted_files:
@@ -420,9 +538,12 @@ def phase_scout_ctx(ctx: Context) -> None:
             log_fn=ctx.log
         )
 
-    # Annotate large files to prevent token waste
-    annotate_file_sizes(
+    # Golden Rule: grep for callers/importers of targeted files, and
+    # annotate large files to prevent token waste (one rewrite of scout.md)
+    finalize_scout(
         ctx.scout_file,
+        scout_content,
+        targeted_files,
         ctx.project_root,
         log_fn=ctx.log
     )
@@ -5,6 +5,7 @@ conflict detection.
 from __future__ import annotations
 import json
 import logging
+import math
 import os
 import re
 import shutil
@@ -14,6 +15,8 @@ import threading
 import time
 import signal
 import atexit
+import dataclasses
+import functools
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -214,10 +217,69 @@ def _release_swarm_lock(project_root: Path) -> None:
 # ============================================================================
 # News Ticker: Log Parsing and Status Display
 # ============================================================================
+_PLAN_DONE_PATTERN = re.compile(r"\[PLAN\] Done\. (\d+) steps?\.")
+_STEP_PATTERN = re.compile(r"\[STEP (\d+)(?:, parallel)?\]")
+_COMPLETE_PATTERN = re.compile(r"\[COMPLETE\] Step (\d+)")
+_COST_PATTERN = re.compile(r"\[COST\].*?\$(\d+\.?\d*)")
+
+
+@dataclass
+class _LogScan:
+    """Running totals for one worker log, advanced as the log grows."""
+    ino: int = 0
+    offset: int = 0  # Byte offset just past the last fully scanned line
+    total_steps: Optional[int] = None
+    last_step: Optional[int] = None
+    last_complete: Optional[int] = None
+    saw_verify: bool = False
+    saw_error: bool = False
+    cost: float = 0.0
+
+    def feed(self, text: str) -> None:
+        """Fold a chunk of log text into the running totals."""
+        if self.total_steps is None:
+            plan_match = _PLAN_DONE_PATTERN.search(text)
+            if plan_match:
+                self.total_steps = int(plan_match.group(1))
+
+        step_matches = _STEP_PATTERN.findall(text)
+        if step_matches:
+            self.last_step = int(step_matches[-1])
+
+        complete_matches = _COMPLETE_PATTERN.findall(text)
+        if complete_matches:
+            self.last_complete = int(complete_matches[-1])
+
+        self.saw_verify = self.saw_verify or "[VERIFY]" in text
+        self.saw_error = self.saw_error or "[ERROR]" in text
+
+        for c in _COST_PATTERN.findall(text):
+            try:
+                self.cost += float(c)
+            except ValueError:
+                pass
+
+
+# Status polls re-read every active log each interval; keep per-log totals so
+# each poll only scans bytes appended since the last one.
+_log_scans: Dict[str, _LogScan] = {}
+_log_scans_lock = threading.Lock()
+
+
+def _forget_log_scan(log_path: Path) -> None:
+    """Drop the cached scan state for a worker log that won't be polled again."""
+    with _log_scans_lock:
+        _log_scans.pop(str(log_path), None)
+
+
 def parse_worker_log(log_path: Path) -> Tuple[str, int, int, float]:
     """
     Parse worker log file to extract current status.
 
+    Scanning is incremental: complete lines are folded into a cached
+    per-path total, and only the trailing partial line is re-read on the
+    next call. A rewritten or truncated log starts a fresh scan.
+
     Args:
         log_path: Path to worker's log.md file
 
@@ -225,52 +287,52 @@ def parse_worker_log(log_path: Path) -> Tuple[str, int, int, float]:
         Tuple of (phase, current_step, total_steps, cost)
         phase: "scout", "plan", "step", "verify", "done", "error"
     """
-    if not log_path.exists():
-        return ("starting", 0, 0, 0.0)
-
-    try:
-        content = log_path.read_text(encoding="utf-8", errors="replace")
-    except (IOError, OSError):
-        return ("starting", 0, 0, 0.0)
+    key = str(log_path)
+    with _log_scans_lock:
+        try:
+            with open(log_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                scan = _log_scans.get(key)
+                if scan is None or scan.ino != st.st_ino or st.st_size < scan.offset:
+                    scan = _LogScan(ino=st.st_ino)
+                    _log_scans[key] = scan
+                f.seek(scan.offset)
+                data = f.read()
+        except (IOError, OSError):
+            return ("starting", 0, 0, 0.0)
+
+        cut = data.rfind(b"\n") + 1
+        if cut:
+            scan.feed(data[:cut].decode("utf-8", errors="replace"))
+            scan.offset += cut
+        view = scan
+        if cut < len(data):
+            # Unterminated last line: count it now, but rescan it next time
+            view = dataclasses.replace(scan)
+            view.feed(data[cut:].decode("utf-8", errors="replace"))
 
     phase = "starting"
     current_step = 0
     total_steps = 0
-    cost = 0.0
 
-    # Parse total steps from [PLAN] Done. N steps.
-    plan_match = re.search(r"\[PLAN\] Done\. (\d+) steps?\.", content)
-    if plan_match:
-        total_steps = int(plan_match.group(1))
+    if view.total_steps is not None:
+        total_steps = view.total_steps
         phase = "plan"
 
-    # Parse current step from [STEP N] or [COMPLETE] Step N
-    step_matches = re.findall(r"\[STEP (\d+)\]", content)
-    if step_matches:
-        current_step = int(step_matches[-1])  # Last step mentioned
+    if view.last_step is not None:
+        current_step = view.last_step
         phase = "step"
 
-    complete_matches = re.findall(r"\[COMPLETE\] Step (\d+)", content)
-    if complete_matches:
-        current_step = int(complete_matches[-1])
+    if view.last_complete is not None:
+        current_step = view.last_complete
 
-    # Check for verify phase
-    if "[VERIFY]" in content:
+    if view.saw_verify:
         phase = "verify"
 
-    # Check for errors
-    if "[ERROR]" in content:
+    if view.saw_error:
         phase = "error"
 
-    # Sum up all costs
-    cost_matches = re.findall(r"\[COST\].*?\$(\d+\.?\d*)", content)
-    for c in cost_matches:
-        try:
-            cost += float(c)
-        except ValueError:
-            pass
-
-    return (phase, current_step, total_steps, cost)
+    return (phase, current_step, total_steps, view.cost)
 
 
 def format_status_block(
@@ -532,7 +594,7 @@ _NO_TARGETS_SENTINEL = "__NO_TARGETS__"
 def _partition_tasks_by_conflict(
     task_paths: List[str],
     project_root: Path
-) -> Tuple[List[List[str]], List[str]]:
+) -> Tuple[List[List[str]], List[str], List[str]]:
     """
     Partition tasks into conflict groups based on overlapping targets.
 
@@ -544,9 +606,11 @@ def _partition_tasks_by_conflict(
         project_root: Root directory for path resolution
 
     Returns:
-        (conflict_groups, parallel_tasks)
+        (conflict_groups, parallel_tasks, unscoped_group)
         - conflict_groups: Lists of tasks that must run sequentially within group
         - parallel_tasks: Tasks with no conflicts, can run fully parallel
+        - unscoped_group: Two or more tasks without usable TARGETS; they may
+          touch any file, so they run one at a time with nothing alongside
     """
     # Build task -> files mapping
     task_to_files: Dict[str, Set[str]] = {}
@@ -607,15 +671,19 @@ def _partition_tasks_by_conflict(
         groups[root].append(task)
 
     # Separate conflict groups (size > 1) from parallel tasks (size == 1)
+    unscoped = file_to_tasks.get(_NO_TARGETS_SENTINEL, [])
     conflict_groups: List[List[str]] = []
     parallel_tasks: List[str] = []
+    unscoped_group: List[str] = []
     for group in groups.values():
-        if len(group) > 1:
+        if len(group) > 1 and len(unscoped) > 1 and unscoped[0] in group:
+            unscoped_group = group
+        elif len(group) > 1:
             conflict_groups.append(group)
         else:
             parallel_tasks.append(group[0])
 
-    return conflict_groups, parallel_tasks
+    return conflict_groups, parallel_tasks, unscoped_group
 
 
 # ============================================================================
@@ -676,6 +744,27 @@ def _kill_process_tree(proc: subprocess.Popen, timeout: float = 5.0) -> None:
         pass  # Process already dead
 
 
+@functools.lru_cache(maxsize=1)
+def _claude_on_path() -> Optional[str]:
+    """Locate the Claude CLI once for all workers spawned by this swarm."""
+    return shutil.which("claude")
+
+
+def _worker_env(work_dir: str) -> Dict[str, str]:
+    """Environment for a worker zen process.
+
+    Passes the resolved Claude CLI path down as CLAUDE_EXE (unless already
+    set) so each worker skips its own PATH search.
+    """
+    env = {**os.environ}
+    env["ZEN_WORK_DIR"] = work_dir
+    if not env.get("CLAUDE_EXE"):
+        claude_exe = _claude_on_path()
+        if claude_exe:
+            env["CLAUDE_EXE"] = claude_exe
+    return env
+
+
 def _run_worker_popen(
     cmd: List[str],
     cwd: Path,
@@ -779,8 +868,7 @@ def execute_worker_task(task_path: str, work_dir: str, project_root: Path,
         work_path.mkdir(parents=True, exist_ok=True)
 
         # Override .zen folder via environment variable
-        env = {**os.environ}
-        env["ZEN_WORK_DIR"] = work_dir
+        env = _worker_env(work_dir)
 
         # Use file-based output to avoid pipe buffer deadlocks
         log_file = work_path / "log.md"
@@ -898,10 +986,14 @@ def _worker_thread_target(
     semaphore: threading.Semaphore,
     completed_tasks: Dict[str, bool],
     completed_lock: threading.Lock,
+    stop_event: Optional[threading.Event] = None,
 ) -> None:
     """
     Thread target that executes a worker task.
 
+    If ``stop_event`` is set by the time a worker slot frees up, the task is
+    not started and no result is recorded.
+
     Note: Daemon thread - will be killed on Ctrl+C. Results may be incomplete
     on interrupt, but worker logs are preserved in .zen/worker_*/log.md
     """
@@ -909,6 +1001,8 @@ def _worker_thread_target(
 
     try:
         with semaphore:
+            if stop_event is not None and stop_event.is_set():
+                return
             result = execute_worker_task(task, str(work_dir), project_root, scout_context)
     except BaseException as e:
         logger.error(f"[SWARM] Worker thread crashed: {e}")
@@ -1007,9 +1101,9 @@ class SwarmDispatcher:
         self.config = config
         self.results: List[WorkerResult] = []
 
-    def _run_tasks_parallel(
+    def _run_task_chains(
         self,
-        tasks: List[str],
+        chains: List[List[str]],
         task_num_offset: int,
         work_dir_map: Dict[str, Tuple[str, int]],
         results_dict: Dict[str, WorkerResult],
@@ -1018,16 +1112,22 @@ class SwarmDispatcher:
         completed_lock: threading.Lock,
     ) -> List[Tuple[str, str]]:
         """
-        Run a batch of tasks in parallel with the configured worker count.
+        Run chains of tasks concurrently with the configured worker count.
+
+        Tasks within a chain run one after another (a conflict group); chains
+        run side by side. Each task takes a worker slot only while it runs, so
+        a worker freed by a short task immediately picks up the next task of
+        any chain instead of idling until a whole batch finishes.
 
         Returns list of (task, work_dir) tuples for tracking.
         """
         scout_context = None
-        task_configs = [
-            (task, f"{self.config.work_dir_base}_{uuid4().hex[:8]}",
-             self.config.project_root, scout_context)
-            for task in tasks
+        chain_configs = [
+            [(task, f"{self.config.work_dir_base}_{uuid4().hex[:8]}",
+              self.config.project_root, scout_context) for task in chain]
+            for chain in chains
         ]
+        task_configs = [tc for chain in chain_configs for tc in chain]
 
         # Update work_dir_map for status monitoring
         for idx, (task, work_dir, _, _) in enumerate(task_configs):
@@ -1035,37 +1135,44 @@ class SwarmDispatcher:
 
         # Thread-based execution with Popen
         semaphore = threading.Semaphore(self.config.workers)
+        # Set at the deadline so no task starts after it has been reported failed
+        stop_event = threading.Event()
         worker_threads: List[threading.Thread] = []
 
-        for task_config in task_configs:
-            t = threading.Thread(
-                target=_worker_thread_target,
-                args=(task_config, results_dict, results_lock, semaphore,
-                      completed_tasks, completed_lock),
-                daemon=True,
-            )
+        def run_chain(chain: List[Tuple[str, str, Path, Optional[str]]]) -> None:
+            for task_config in chain:
+                if stop_event.is_set():
+                    return
+                _worker_thread_target(task_config, results_dict, results_lock, semaphore,
+                                      completed_tasks, completed_lock, stop_event)
+
+        for chain in chain_configs:
+            t = threading.Thread(target=run_chain, args=(chain,), daemon=True)
             t.start()
             worker_threads.append(t)
 
-        # Wait for all threads with overall timeout
-        deadline = time.time() + TIMEOUT_WORKER + 30
+        # Wait for all threads with overall timeout. Tasks queue for worker
+        # slots, and a chain runs its tasks back to back, so allow for
+        # whichever is longer.
+        longest_chain = max((len(chain) for chain in chain_configs), default=1)
+        rounds = max(longest_chain, math.ceil(len(task_configs) / self.config.workers))
+        deadline = time.time() + TIMEOUT_WORKER * rounds + 30
         for t in worker_threads:
             remaining = max(0.1, deadline - time.time())
             t.join(timeout=remaining)
+        stop_event.set()
 
         # Check for stragglers
-        for idx, t in enumerate(worker_threads):
-            if t.is_alive():
-                task, work_dir, _, _ = task_configs[idx]
-                logger.error(f"[SWARM] Worker thread for {task} did not complete")
-                with results_lock:
-                    if work_dir not in results_dict:
-                        results_dict[work_dir] = WorkerResult(
-                            task_path=task,
-                            work_dir=work_dir,
-                            returncode=124,
-                            stderr="Worker thread did not complete within timeout",
-                        )
+        for task, work_dir, _, _ in task_configs:
+            with results_lock:
+                if work_dir not in results_dict:
+                    logger.error(f"[SWARM] Worker thread for {task} did not complete")
+                    results_dict[work_dir] = WorkerResult(
+                        task_path=task,
+                        work_dir=work_dir,
+                        returncode=124,
+                        stderr="Worker thread did not complete within timeout",
+                    )
 
         return [(tc[0], tc[1]) for tc in task_configs]
 
@@ -1109,12 +1216,14 @@ class SwarmDispatcher:
         self.results = []
 
         # Partition tasks by conflict
-        conflict_groups, parallel_tasks = _partition_tasks_by_conflict(
+        conflict_groups, parallel_tasks, unscoped_group = _partition_tasks_by_conflict(
             self.config.tasks, self.config.project_root
         )
 
         # Log partitioning results
         total_tasks = len(self.config.tasks)
+        if unscoped_group:
+            logger.info(f"[SWARM] {len(unscoped_group)} tasks have no TARGETS, will run one at a time first")
         if conflict_groups:
             conflict_count = sum(len(g) for g in conflict_groups)
             logger.info(f"[SWARM] {conflict_count} tasks have conflicts, will run sequentially in {len(conflict_groups)} group(s)")
@@ -1151,9 +1260,10 @@ class SwarmDispatcher:
                 completed_count = max_completed_seen
 
                 for work_dir, (task_path, task_num) in work_dir_map.items():
+                    log_path = self.config.project_root / work_dir / "log.md"
                     if work_dir in completed_set:
+                        _forget_log_scan(log_path)
                         continue
-                    log_path = self.config.project_root / work_dir / "log.md"
                     phase, current, total, cost = parse_worker_log(log_path)
                     total_cost += cost
                     worker_statuses.append((task_num, phase, current, total))
@@ -1171,19 +1281,20 @@ class SwarmDispatcher:
             monitor_thread = threading.Thread(target=status_monitor, daemon=True)
             monitor_thread.start()
 
-        # Phase 1: Run conflict groups sequentially (tasks within each group run one at a time)
-        for group in conflict_groups:
-            for task in group:
-                self._run_tasks_parallel(
-                    [task], task_num_counter, work_dir_map, results_dict,
-                    results_lock, completed_tasks, completed_lock
-                )
-                task_num_counter += 1
-
-        # Phase 2: Run parallel tasks (all at once, respecting worker limit)
-        if parallel_tasks:
-            self._run_tasks_parallel(
-                parallel_tasks, task_num_counter, work_dir_map, results_dict,
+        # Tasks without TARGETS could touch anything: run them alone, in order
+        for task in unscoped_group:
+            self._run_task_chains(
+                [[task]], task_num_counter, work_dir_map, results_dict,
+                results_lock, completed_tasks, completed_lock
+            )
+            task_num_counter += 1
+
+        # Conflict groups run one task at a time, alongside each other and the
+        # conflict-free tasks, all sharing the worker limit
+        chains = [list(group) for group in conflict_groups] + [[task] for task in parallel_tasks]
+        if chains:
+            self._run_task_chains(
+                chains, task_num_counter, work_dir_map, results_dict,
                 results_lock, completed_tasks, completed_lock
             )
 
@@ -1199,6 +1310,8 @@ class SwarmDispatcher:
                 logger.warning("[SWARM] Monitor thread did not terminate cleanly")
             if is_tty:
                 logger.info("")
+            for work_dir in work_dir_map:
+                _forget_log_scan(self.config.project_root / work_dir / "log.md")
 
         # Preserve worker logs in .zen/workers/ before cleanup
         workers_log_dir = self.config.project_root / self.config.work_dir_base / "workers"
@@ -1502,9 +1615,8 @@ def _execute_in_worktree(worktree_task: WorktreeTask, config: SwarmConfig) -> Wo
             rel_paths = [str(f.relative_to(effective_cwd)) for f in expanded]
             cmd.extend(["--allowed-files", ",".join(rel_paths)])
 
-    env = {**os.environ}
+    env = _worker_env(".zen")  # Just the dir name, cwd handles the path
     work_dir = effective_cwd / ".zen"
-    env["ZEN_WORK_DIR"] = ".zen"  # Just the dir name, cwd handles the path
     work_dir.mkdir(parents=True, exist_ok=True)
     log_file = work_dir / "log.md"
 
@@ -5,6 +5,7 @@ Separates test verification (haiku) from test fixing (sonnet).
 """
 from __future__ import annotations
 
+import fnmatch
 import os
 import re
 import shutil
@@ -58,6 +59,57 @@ _CLAUSE_SPLIT = re.compile(r"[,;|()\[\]{}\n]")
 _DIGIT = re.compile(r"\d+")
 _FILE_LINE_PATTERN = re.compile(r'File "([^"]+)", line (\d+)')
 
+# Markers of genuine test runner output, one alternation per list
+_REAL_TEST_OUTPUT = re.compile(
+    "|".join(f"(?:{p})" for p in (
+        # pytest
+        r"=+\s+\d+\s+passed",
+        r"=+\s+passed in \d+",
+        r"\d+\s+passed",
+        r"passed in [\d.]+s",
+        r"PASSED|FAILED|ERROR",
+        # npm/jest
+        r"Tests:\s+\d+\s+passed",
+        r"Test Suites:\s+\d+\s+passed",
+        # cargo
+        r"test result: ok\.",
+        r"running \d+ tests?",
+        r"\d+ passed; \d+ failed",
+        # go
+        r"^ok\s+\S+\s+[\d.]+s",
+        r"^PASS$",
+        # gradle/java
+        r"BUILD SUCCESSFUL",
+        r"tests? passed",
+        r"\d+ tests? completed",
+        # generic
+        r"\d+\s+tests?\s+(passed|succeeded|ok)",
+        r"All \d+ tests? passed",
+    )),
+    re.MULTILINE | re.IGNORECASE,
+)
+# Every pattern above contains one of these (lowercase); skip the regex when none match
+_REAL_TEST_OUTPUT_KEYS = ("pass", "fail", "error", "test", "ok", "build successful")
+
+_NO_TESTS_OUTPUT = re.compile(
+    "|".join(f"(?:{p})" for p in (
+        r"no tests ran",
+        r"collected 0 items",
+        r"no tests collected",
+        r"no tests found",
+        r"Test Suites:\s+0",
+        r"running 0 tests",
+        r"0 passed; 0 failed; 0 ignored",
+        r"\?\s+.*no test files",
+        r"no test files",
+        r"^0 tests",
+        r"no tests? (found|exist|defined|available)",
+    )),
+    re.MULTILINE | re.IGNORECASE,
+)
+# Every pattern above contains one of these (lowercase); skip the regex when none match
+_NO_TESTS_OUTPUT_KEYS = ("no test", "collected 0", "test suites", "running 0", "0 passed", "0 test")
+
 
 # -----------------------------------------------------------------------------
 # Exceptions
@@ -107,6 +159,28 @@ def truncate_preserve_tail(text: str, max_chars: int = 2000) -> str:
     return text[:head_size] + "\n... (truncated) ...\n" + text[-tail_size:]
 
 
+def read_output_tail(path: Path, max_bytes: int) -> bytes:
+    """
+    Read at most the last max_bytes of a file.
+
+    Test runners print their summary last, so a bounded read keeps the tail
+    rather than the head. A cut inside a UTF-8 sequence is realigned.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size <= max_bytes:
+            f.seek(0)
+            return f.read()
+        f.seek(size - max_bytes)
+        data = f.read()
+
+    # Skip continuation bytes left over from a split multi-byte character
+    start = 0
+    while start < min(len(data), 3) and 0x80 <= data[start] < 0xC0:
+        start += 1
+    return data[start:]
+
+
 def extract_filenames(test_output: str) -> list[str]:
     """
     Extract unique filenames from test tracebacks.
@@ -128,37 +202,10 @@ def verify_test_output(output: str) -> bool:
     Verify that agent output contains real test results, not just claims.
     Returns True if genuine test output is detected.
     """
-    real_test_patterns = [
-        # pytest
-        r"=+\s+\d+\s+passed",
-        r"=+\s+passed in \d+",
-        r"\d+\s+passed",
-        r"passed in [\d.]+s",
-        r"PASSED|FAILED|ERROR",
-        # npm/jest
-        r"Tests:\s+\d+\s+passed",
-        r"Test Suites:\s+\d+\s+passed",
-        # cargo
-        r"test result: ok\.",
-        r"running \d+ tests?",
-        r"\d+ passed; \d+ failed",
-        # go
-        r"^ok\s+\S+\s+[\d.]+s",
-        r"^PASS$",
-        # gradle/java
-        r"BUILD SUCCESSFUL",
-        r"tests? passed",
-        r"\d+ tests? completed",
-        # generic
-        r"\d+\s+tests?\s+(passed|succeeded|ok)",
-        r"All \d+ tests? passed",
-    ]
-
-    for pattern in real_test_patterns:
-        if re.search(pattern, output, re.MULTILINE | re.IGNORECASE):
-            return True
-
-    return False
+    lowered = output.lower()
+    if not any(key in lowered for key in _REAL_TEST_OUTPUT_KEYS):
+        return False
+    return _REAL_TEST_OUTPUT.search(output) is not None
 
 
 def detect_no_tests(output: str) -> bool:
@@ -169,25 +216,10 @@ def detect_no_tests(output: str) -> bool:
     if not output:
         return False
 
-    no_test_patterns = [
-        r"no tests ran",
-        r"collected 0 items",
-        r"no tests collected",
-        r"no tests found",
-        r"Test Suites:\s+0",
-        r"running 0 tests",
-        r"0 passed; 0 failed; 0 ignored",
-        r"\?\s+.*no test files",
-        r"no test files",
-        r"^0 tests",
-        r"no tests? (found|exist|defined|available)",
-    ]
-
-    for pattern in no_test_patterns:
-        if re.search(pattern, output, re.MULTILINE | re.IGNORECASE):
-            return True
-
-    return False
+    lowered = output.lower()
+    if not any(key in lowered for key in _NO_TESTS_OUTPUT_KEYS):
+        return False
+    return _NO_TESTS_OUTPUT.search(output) is not None
 
 
 def project_has_tests(project_root: Path) -> bool:
@@ -198,16 +230,18 @@ def project_has_tests(project_root: Path) -> bool:
     """
     skip_dirs = {'.git', 'node_modules', 'venv', '.venv', '__pycache__', '.zen'}
 
-    for root, dirs, files in os.walk(project_root):
+    root_str = str(project_root)
+    for root, dirs, files in os.walk(root_str):
         dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith('.')]
 
-        depth = len(Path(root).relative_to(project_root).parts)
+        rel = root[len(root_str):].strip(os.sep)
+        depth = rel.count(os.sep) + 1 if rel else 0
         if depth > 3:
             dirs.clear()
             continue
 
         for f in files:
-            if linter.TEST_FILE_PATTERNS.search(str(Path(root) / f)):
+            if linter.TEST_FILE_PATTERNS.search(os.path.join(root, f)):
                 return True
 
     return False
@@ -245,8 +279,24 @@ def detect_project_runtime(project_root: Path) -> Tuple[Optional[str], bool]:
         ("*.cabal", "cabal"),
     ]
 
+    # One directory listing instead of a glob (and listing) per pattern
+    try:
+        with os.scandir(project_root) as it:
+            entries = {entry.name for entry in it}
+    except OSError:
+        entries = set()
+    folded = {name.casefold() for name in entries}
+
     for config_pattern, runtime in checks:
-        if list(project_root.glob(config_pattern)):
+        if "*" in config_pattern:
+            # fnmatch normcases both sides, matching like Path.glob per platform
+            found = any(fnmatch.fnmatch(name, config_pattern) for name in entries)
+        else:
+            # Only a name differing in case needs the filesystem to decide
+            found = config_pattern in entries or (
+                config_pattern.casefold() in folded and (project_root / config_pattern).exists()
+            )
+        if found:
             return runtime, shutil.which(runtime) is not None
 
     # No specific config found - assume Python (always available)
@@ -388,6 +438,7 @@ End with exactly one of:
         log_fn=ctx.log,
         cost_callback=ctx.record_cost,
         timeout=TIMEOUT_VERIFY,
+        stop_markers=("TESTS_PASS", "TESTS_FAIL", "TESTS_NONE", "TESTS_ERROR"),
     )
 
     if not output:
@@ -399,14 +450,15 @@ End with exactly one of:
         ctx.log( "[VERIFY] Agent did not write test output file.")
         return VerifyState.ERROR, ""
 
-    # Size-limited read to prevent OOM from huge test output
+    # Size-limited read to prevent OOM from huge test output; keep the tail,
+    # where the pass/fail summary lives
+    raw = read_output_tail(ctx.test_output_file, MAX_TEST_OUTPUT_RAW)
     try:
-        with open(ctx.test_output_file, "r", encoding="utf-8") as f:
-            test_output = f.read(MAX_TEST_OUTPUT_RAW)
+        test_output = raw.decode("utf-8")
     except UnicodeDecodeError:
         ctx.log("[WARN] Test output contains non-UTF-8 bytes, using latin-1 fallback")
-        with open(ctx.test_output_file, "r", encoding="latin-1") as f:
-            test_output = f.read(MAX_TEST_OUTPUT_RAW)
+        test_output = raw.decode("latin-1")
+    test_output = test_output.replace("\r\n", "\n").replace("\r", "\n")
 
     # Determine state from output markers and test results
     if "TESTS_NONE" in output or detect_no_tests(test_output):
@@ -90,6 +90,22 @@ class TestInitClaude:
             claude._claude_exe = original
 
 
+class TestLastLine:
+    """Tests for last_line() helper."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("", ""),
+        ("   \n\n", ""),
+        ("  STEP_COMPLETE  ", "STEP_COMPLETE"),
+        ("work done\nSTEP_BLOCKED: reason\n\n", "STEP_BLOCKED: reason"),
+        ("a\r\nb\r\n", "b"),
+    ])
+    def test_matches_strip_split(self, text, expected):
+        from zen_mode.claude import last_line
+        assert last_line(text) == expected
+        assert last_line(text) == (text.strip().split("\n")[-1].strip() if text.strip() else "")
+
+
 class TestParseJsonResponse:
     """Tests for _parse_json_response() function."""
 
@@ -166,6 +182,14 @@ class TestExtractCost:
         cost, tokens = _extract_cost(raw)
         assert cost == 0.0
 
+    def test_partial_usage_keeps_present_counts(self):
+        """A missing counter defaults to 0 without dropping the others."""
+        from zen_mode.claude import _extract_cost
+
+        raw = {"total_cost_usd": 0.01, "usage": {"input_tokens": 100, "output_tokens": 50}}
+        cost, tokens = _extract_cost(raw)
+        assert tokens == {"in": 100, "out": 50, "cache_read": 0}
+
     def test_handles_missing_usage(self):
         """Should handle missing usage field."""
         from zen_mode.claude import _extract_cost
@@ -329,8 +353,7 @@ class TestRunClaudeSuccess:
         from zen_mode.claude import run_claude
         run_claude("Test prompt here", "sonnet", project_root=tmp_path)
 
-        mock_proc.stdin.write.assert_called_once_with("Test prompt here")
-        mock_proc.stdin.close.assert_called_once()
+        assert mock_proc.communicate.call_args.kwargs["input"] == "Test prompt here"
 
     @pytest.mark.bypass_conftest_patch
     @patch('zen_mode.claude.subprocess.Popen')
@@ -468,16 +491,34 @@ class TestRunClaudeErrors:
         monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
 
         mock_proc = MagicMock()
-        mock_proc.returncode = 0
         mock_proc.stdin.write.side_effect = BrokenPipeError("pipe broken")
-        mock_proc.communicate.return_value = ('{"result": "ok"}', '')
+        mock_proc.stdout = iter(['{"type": "result", "result": "ok"}\n'])
+        mock_proc.stderr.read.return_value = ""
+        mock_proc.returncode = 0
         mock_popen.return_value = mock_proc
 
         from zen_mode.claude import run_claude
         # Should not raise, should continue and return result
-        result = run_claude("test", "sonnet", project_root=tmp_path)
+        result = run_claude("test", "sonnet", project_root=tmp_path, stop_markers=("DONE",))
         assert result == "ok"
 
+    @pytest.mark.bypass_conftest_patch
+    def test_real_process_receives_prompt(self, tmp_path, monkeypatch):
+        """Prompt reaches a real child process through stdin."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        script = tmp_path / "echo_claude.py"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            "print(json.dumps({'result': sys.stdin.read()}))\n"
+        )
+        script.chmod(0o755)
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=str(script)):
+            result = run_claude("hello stdin", "sonnet", project_root=tmp_path)
+        assert result == "hello stdin"
+
 
 class TestRunClaudeTimeout:
     """Tests for timeout handling in run_claude()."""
@@ -553,7 +594,7 @@ class TestRunClaudeTimeout:
         from zen_mode.claude import run_claude
         run_claude("test", "sonnet", project_root=tmp_path, timeout=120)
 
-        mock_proc.communicate.assert_called_once_with(timeout=120)
+        mock_proc.communicate.assert_called_once_with(input="test", timeout=120)
 
 
 class TestRunClaudeOSErrors:
@@ -821,3 +862,315 @@ class TestRunClaudeIntegration:
         result = run_claude("test", "sonnet", project_root=tmp_path)
 
         assert result == "answer"
+
+
+class TestRunClaudeStreaming:
+    """Tests for run_claude() with stop_markers (stream-json output)."""
+
+    @staticmethod
+    def _fake_cli(tmp_path, events, sleep=30):
+        """Write an executable that prints stream-json events, then hangs."""
+        script = tmp_path / "fake_claude.py"
+        lines = "\n".join(f"print({json.dumps(json.dumps(e))}, flush=True)" for e in events)
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import sys, time\n"
+            "sys.stdin.read()\n"
+            f"{lines}\n"
+            f"time.sleep({sleep})\n"
+        )
+        script.chmod(0o755)
+        return str(script)
+
+    @staticmethod
+    def _assistant(text, msg_id="m1", tool=False, stop_reason="end_turn"):
+        content = [{"type": "text", "text": text}] if text else []
+        if tool:
+            content.append({"type": "tool_use", "name": "Edit", "input": {}})
+            stop_reason = "tool_use"
+        return {"type": "assistant", "message": {
+            "id": msg_id, "content": content, "stop_reason": stop_reason,
+            "usage": {"input_tokens": 10, "output_tokens": 5},
+        }}
+
+    @pytest.mark.bypass_conftest_patch
+    def test_stops_on_marker_without_waiting(self, tmp_path, monkeypatch):
+        """Process is terminated shortly after the final marker line."""
+        import time
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        exe = self._fake_cli(tmp_path, [
+            {"type": "system", "subtype": "init"},
+            self._assistant("Edited file.\nSTEP_COMPLETE"),
+        ])
+        tokens_seen = []
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            start = time.monotonic()
+            result = run_claude("do it", "sonnet", project_root=tmp_path, timeout=60,
+                                stop_markers=("STEP_COMPLETE", "STEP_BLOCKED"),
+                                cost_callback=lambda p, c, t: tokens_seen.append(t))
+            elapsed = time.monotonic() - start
+
+        assert result == "Edited file.\nSTEP_COMPLETE"
+        assert elapsed < 15
+        assert tokens_seen == [{"in": 10, "out": 5, "cache_read": 0}]
+
+    @pytest.mark.bypass_conftest_patch
+    def test_prefers_result_event(self, tmp_path, monkeypatch):
+        """The CLI's result event (with cost) is used when it arrives."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        exe = self._fake_cli(tmp_path, [
+            self._assistant("STEP_COMPLETE"),
+            {"type": "result", "result": "STEP_COMPLETE", "total_cost_usd": 0.02},
+        ], sleep=0)
+        costs = []
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            result = run_claude("do it", "sonnet", project_root=tmp_path,
+                                stop_markers=("STEP_COMPLETE",),
+                                cost_callback=lambda p, c, t: costs.append(c))
+
+        assert result == "STEP_COMPLETE"
+        assert costs == [0.02]
+
+    @pytest.mark.bypass_conftest_patch
+    def test_marker_alongside_tool_call_does_not_stop(self, tmp_path, monkeypatch):
+        """A marker in a message that also calls a tool isn't final."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        exe = self._fake_cli(tmp_path, [
+            self._assistant("Will print STEP_COMPLETE\nSTEP_COMPLETE", tool=True),
+            self._assistant("Done\nSTEP_COMPLETE", msg_id="m2"),
+        ])
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            result = run_claude("do it", "sonnet", project_root=tmp_path, timeout=60,
+                                stop_markers=("STEP_COMPLETE",))
+
+        assert result == "Done\nSTEP_COMPLETE"
+
+    @pytest.mark.bypass_conftest_patch
+    def test_marker_block_followed_by_tool_block_does_not_stop(self, tmp_path, monkeypatch):
+        """A text block ending on a marker isn't final while its message may still call a tool."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        exe = self._fake_cli(tmp_path, [
+            self._assistant("Next I will edit.\nSTEP_COMPLETE: 1", stop_reason=None),
+            {"type": "system", "subtype": "hook"},
+            self._assistant("", tool=True),
+            self._assistant("Done\nSTEP_COMPLETE: 2", msg_id="m2"),
+        ])
+        texts = []
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            result = run_claude("do it", "sonnet", project_root=tmp_path, timeout=60,
+                                stop_markers=("STEP_COMPLETE",), text_callback=texts.append)
+
+        assert result == "Done\nSTEP_COMPLETE: 2"
+        assert texts == ["Next I will edit.\nSTEP_COMPLETE: 1", "Done\nSTEP_COMPLETE: 2"]
+
+    @pytest.mark.bypass_conftest_patch
+    def test_marker_message_without_stop_reason_waits_for_next_event(self, tmp_path, monkeypatch):
+        """Without a stop_reason, an event for another message confirms the marker message ended."""
+        import time
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        exe = self._fake_cli(tmp_path, [
+            self._assistant("STEP_COMPLETE", stop_reason=None),
+            self._assistant("", msg_id="m2", stop_reason=None),
+        ])
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            start = time.monotonic()
+            result = run_claude("do it", "sonnet", project_root=tmp_path, timeout=60,
+                                stop_markers=("STEP_COMPLETE",))
+            elapsed = time.monotonic() - start
+
+        assert result == "STEP_COMPLETE"
+        assert elapsed < 15
+
+    @pytest.mark.bypass_conftest_patch
+    def test_error_result_returns_none(self, tmp_path, monkeypatch):
+        """A result event flagged is_error is a failure, not a response."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        exe = self._fake_cli(tmp_path, [
+            {"type": "result", "is_error": True, "result": "Max turns reached"},
+        ], sleep=0)
+        logs = []
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            result = run_claude("do it", "sonnet", project_root=tmp_path,
+                                stop_markers=("STEP_COMPLETE",), log_fn=logs.append)
+
+        assert result is None
+        assert any("[ERROR]" in msg for msg in logs)
+
+    @pytest.mark.bypass_conftest_patch
+    def test_nonzero_exit_returns_none(self, tmp_path, monkeypatch):
+        """A CLI that exits non-zero on its own is a failure even with a result event."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        script = tmp_path / "fake_claude.py"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "sys.stdin.read()\n"
+            "print('{\"type\": \"result\", \"result\": \"partial\"}', flush=True)\n"
+            "sys.stderr.write('API error')\n"
+            "sys.exit(1)\n"
+        )
+        script.chmod(0o755)
+        logs = []
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=str(script)):
+            result = run_claude("do it", "sonnet", project_root=tmp_path,
+                                stop_markers=("STEP_COMPLETE",), log_fn=logs.append)
+
+        assert result is None
+        assert any("API error" in msg for msg in logs)
+
+    @pytest.mark.bypass_conftest_patch
+    def test_tool_result_events_not_decoded(self, tmp_path, monkeypatch):
+        """user/system events (tool results, init) are skipped without parsing."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        exe = self._fake_cli(tmp_path, [
+            {"type": "system", "subtype": "init"},
+            {"type": "user", "message": {"content": [{"type": "tool_result", "content": "x" * 10000}]}},
+            self._assistant("STEP_COMPLETE"),
+        ])
+        decoded = []
+        real_loads = json.loads
+        monkeypatch.setattr('zen_mode.claude.json.loads',
+                            lambda s, *a, **k: decoded.append(s) or real_loads(s, *a, **k))
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            result = run_claude("do it", "sonnet", project_root=tmp_path, timeout=60,
+                                stop_markers=("STEP_COMPLETE",))
+
+        assert result == "STEP_COMPLETE"
+        assert len(decoded) == 1
+
+    @pytest.mark.bypass_conftest_patch
+    def test_timeout_returns_none(self, tmp_path, monkeypatch):
+        """Watchdog kills a stream that never reaches a marker."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        exe = self._fake_cli(tmp_path, [self._assistant("still working")])
+
+        from zen_mode.claude import run_claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            result = run_claude("do it", "sonnet", project_root=tmp_path, timeout=1,
+                                stop_markers=("STEP_COMPLETE",))
+
+        assert result is None
+
+    @pytest.mark.bypass_conftest_patch
+    @patch('zen_mode.claude.subprocess.Popen')
+    @patch('zen_mode.claude._init_claude', return_value='/usr/bin/claude')
+    def test_uses_stream_json_format(self, mock_init, mock_popen, tmp_path, monkeypatch):
+        """stop_markers switches the CLI to stream-json output."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        mock_proc = MagicMock()
+        mock_proc.stdout = iter([])
+        mock_proc.stderr.read.return_value = ""
+        mock_popen.return_value = mock_proc
+
+        from zen_mode.claude import run_claude
+        run_claude("x", "sonnet", project_root=tmp_path, stop_markers=("STEP_COMPLETE",))
+
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index("--output-format") + 1] == "stream-json"
+        assert "--verbose" in cmd
+
+
+class TestWaitExit:
+    """Tests for _wait_exit() process reaping."""
+
+    def test_returns_exit_code(self):
+        """Reaps the child and returns its exit code."""
+        from zen_mode.claude import _wait_exit
+
+        proc = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+        assert _wait_exit(proc, 10) == 3
+        assert proc.returncode == 3
+
+    def test_raises_on_timeout(self):
+        """A child still running at the deadline raises TimeoutExpired."""
+        from zen_mode.claude import _wait_exit
+
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            with pytest.raises(subprocess.TimeoutExpired):
+                _wait_exit(proc, 0.2)
+        finally:
+            proc.kill()
+            proc.wait()
+
+
+class TestPrewarm:
+    """Tests for ZEN_PREWARM spare process reuse."""
+
+    @staticmethod
+    def _fake_cli(tmp_path):
+        script = tmp_path / "fake_claude.py"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import json, os, sys\n"
+            "prompt = sys.stdin.read()\n"
+            "print(json.dumps({'result': f'{os.getpid()}:{prompt}'}))\n"
+        )
+        script.chmod(0o755)
+        return str(script)
+
+    @pytest.fixture(autouse=True)
+    def _clean_spares(self):
+        from zen_mode import claude
+        yield
+        claude._shutdown_spares()
+
+    @pytest.mark.bypass_conftest_patch
+    def test_reuses_spare_process(self, tmp_path, monkeypatch):
+        """Second identical call runs on the spare booted by the first."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        monkeypatch.setattr('zen_mode.config.PREWARM_CLI', True)
+        exe = self._fake_cli(tmp_path)
+
+        from zen_mode import claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            first = claude.run_claude("one", "sonnet", project_root=tmp_path)
+            spare_pid = next(iter(claude._spares.values())).pid
+            second = claude.run_claude("two", "sonnet", project_root=tmp_path)
+
+        assert first.endswith(":one")
+        assert second == f"{spare_pid}:two"
+
+    @pytest.mark.bypass_conftest_patch
+    def test_spare_keyed_by_command(self, tmp_path, monkeypatch):
+        """A spare for one model is never used for another."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        monkeypatch.setattr('zen_mode.config.PREWARM_CLI', True)
+        exe = self._fake_cli(tmp_path)
+
+        from zen_mode import claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            claude.run_claude("one", "sonnet", project_root=tmp_path)
+            sonnet_pid = next(iter(claude._spares.values())).pid
+            result = claude.run_claude("two", "haiku", project_root=tmp_path)
+
+        assert not result.startswith(f"{sonnet_pid}:")
+        assert len(claude._spares) == 2
+
+    @pytest.mark.bypass_conftest_patch
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        """Without ZEN_PREWARM no spare processes are left behind."""
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        exe = self._fake_cli(tmp_path)
+
+        from zen_mode import claude
+        with patch('zen_mode.claude._init_claude', return_value=exe):
+            claude.run_claude("one", "sonnet", project_root=tmp_path)
+
+        assert claude._spares == {}
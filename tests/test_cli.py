@@ -42,6 +42,16 @@ class TestCmdInit:
         content = claude_md.read_text()
         assert len(content) > 0
 
+    def test_claude_md_matches_bundled_template(self, tmp_path, monkeypatch):
+        """The template is copied byte for byte."""
+        import importlib.resources as resources
+        monkeypatch.chdir(tmp_path)
+
+        cmd_init(SimpleNamespace())
+
+        bundled = resources.files("zen_mode.defaults").joinpath("CLAUDE.md").read_bytes()
+        assert (tmp_path / "CLAUDE.md").read_bytes() == bundled
+
     def test_idempotent(self, tmp_path, monkeypatch):
         """Running cmd_init twice doesn't error."""
         monkeypatch.chdir(tmp_path)
@@ -111,6 +111,12 @@ class TestParseJsonResponse:
         assert data["outer"]["inner"] == "value"
         assert data["cost"] == 0.01
 
+    def test_trailing_output_ignored(self):
+        """Text after the JSON object (e.g. a trailing warning) is ignored."""
+        json_str = '{"result": "hello"}\nWarning: shutting down\n'
+        data = _parse_json_response(json_str)
+        assert data == {"result": "hello"}
+
 
 class TestCostTrackingIntegration:
     """Integration tests for cost tracking flow."""
@@ -242,3 +248,28 @@ class TestCostBudgetEnforcement:
         monkeypatch.setenv("ZEN_MAX_COST", "0.0")
         importlib.reload(zen_mode.config)
         importlib.reload(zen_mode.context)
+
+
+class TestRecordCost:
+    """Tests for Context.record_cost() totals."""
+
+    def test_totals_consistent_under_concurrency(self, tmp_path):
+        """Costs recorded from parallel step threads are all counted."""
+        import threading
+        from zen_mode.context import Context
+
+        ctx = Context(work_dir=tmp_path / ".zen", task_file="task.md", project_root=tmp_path)
+
+        def record():
+            for _ in range(200):
+                ctx.record_cost("implement", 0.5, {"in": 2, "out": 1, "cache_read": 0})
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(ctx.costs) == 800
+        assert ctx.total_cost == 400.0
+        assert ctx.tokens == 2400
@@ -4,6 +4,7 @@ Tests for file size annotation in scout output.
 import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -26,6 +27,20 @@ class TestCountLinesSafe:
         f.write_text("line1\nline2\nline3\n")
         assert count_lines_safe(f) == 3
 
+    def test_counts_unterminated_last_line(self, tmp_path):
+        """A final line without a newline still counts."""
+        f = tmp_path / "test.py"
+        f.write_bytes(b"line1\r\nline2\nline3")
+        assert count_lines_safe(f) == 3
+
+    def test_recounts_after_file_changes(self, tmp_path):
+        """Cached counts are keyed on the file's stat, so edits are seen."""
+        f = tmp_path / "test.py"
+        f.write_text("a\n")
+        assert count_lines_safe(f) == 1
+        f.write_text("a\nb\nc\n")
+        assert count_lines_safe(f) == 3
+
     def test_returns_none_for_missing_file(self, tmp_path):
         """Return None for non-existent file."""
         f = tmp_path / "missing.py"
@@ -48,6 +63,12 @@ class TestCountLinesSafe:
         result = count_lines_safe(f)
         assert result is not None  # Should return some count, not crash
 
+    def test_binary_file_treated_as_massive(self, tmp_path):
+        """A NUL byte near the start marks the file binary without counting."""
+        f = tmp_path / "data.bin"
+        f.write_bytes(b"\x00" + b"\n" * 10)
+        assert count_lines_safe(f) == 9999
+
     def test_returns_9999_for_huge_file(self, tmp_path):
         """Files over max_bytes return 9999."""
         f = tmp_path / "huge.py"
@@ -105,6 +126,16 @@ class TestAnnotateFileSizes:
         content = scout_file.read_text()
         assert "- `src/big.py` [LARGE]: needs update" in content
 
+    def test_no_eligible_section_returns_early(self, tmp_path):
+        """Scout files without Targeted/Context sections aren't scanned."""
+        scout_file = tmp_path / "scout.md"
+        scout_file.write_text("## Deletion Candidates\n- `old.py`: unused\n")
+
+        with patch("zen_mode.scout.count_lines_safe") as mock_count:
+            annotate_file_sizes(scout_file, tmp_path)
+
+        mock_count.assert_not_called()
+
     def test_skips_deletion_candidates(self, tmp_path):
         """Files in Deletion Candidates section are not annotated."""
         # Create a large file
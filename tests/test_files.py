@@ -5,6 +5,7 @@ from pathlib import Path
 from zen_mode.files import (
     should_ignore_path,
     write_file,
+    drop_lines_containing,
     backup_file,
     log,
     IGNORE_DIRS,
@@ -80,6 +81,10 @@ class TestShouldIgnorePath:
     def test_ignores_zen_directory(self):
         assert should_ignore_path(".zen/scout.md") is True
 
+    def test_leading_dot_slash_is_not_hidden(self):
+        assert should_ignore_path("./src//main.py") is False
+        assert should_ignore_path("./node_modules/pkg/index.js") is True
+
 
 class TestWriteFile:
     """Tests for write_file() function."""
@@ -112,6 +117,65 @@ class TestWriteFile:
         write_file(target, "Hello 世界 🌍")
         assert target.read_text(encoding="utf-8") == "Hello 世界 🌍"
 
+    def test_replaces_unencodable_characters(self, tmp_path):
+        target = tmp_path / "surrogate.txt"
+        write_file(target, "bad \udcff byte")
+        assert target.read_text(encoding="utf-8") == "bad ? byte"
+
+    def test_leaves_no_temp_files(self, tmp_path):
+        target = tmp_path / "output.txt"
+        write_file(target, "one")
+        write_file(target, "two")
+        assert [p.name for p in tmp_path.iterdir()] == ["output.txt"]
+
+    def test_writes_large_content(self, tmp_path):
+        target = tmp_path / "large.txt"
+        content = "line\n" * 500_000
+        write_file(target, content)
+        assert target.read_text() == content
+
+
+class TestDropLinesContaining:
+    """Tests for drop_lines_containing() function."""
+
+    def test_removes_matching_lines(self, tmp_path):
+        target = tmp_path / "log.md"
+        target.write_bytes(b"[STEP 1] a\n[COMPLETE] Step 1\r\n[STEP 2] b\n")
+        drop_lines_containing(target, "[COMPLETE] Step")
+        assert target.read_bytes() == b"[STEP 1] a\n[STEP 2] b\n"
+
+    def test_edges_and_adjacent_matches(self, tmp_path):
+        target = tmp_path / "log.md"
+        target.write_bytes(
+            b"[COMPLETE] Step 1\nkeep 1\n[COMPLETE] Step 2\n"
+            b"x [COMPLETE] Step 3 [COMPLETE] Step 3\nkeep 2\n[COMPLETE] Step 4"
+        )
+        drop_lines_containing(target, "[COMPLETE] Step")
+        assert target.read_bytes() == b"keep 1\nkeep 2\n"
+
+    def test_untouched_when_marker_absent(self, tmp_path):
+        target = tmp_path / "log.md"
+        target.write_text("[STEP 1] a\n")
+        inode = target.stat().st_ino
+        drop_lines_containing(target, "[COMPLETE] Step")
+        assert target.stat().st_ino == inode
+
+    def test_empty_file(self, tmp_path):
+        target = tmp_path / "log.md"
+        target.write_text("")
+        drop_lines_containing(target, "[COMPLETE] Step")
+        assert target.read_text() == ""
+
+    def test_log_appends_after_cleanup(self, tmp_path):
+        work_dir = tmp_path / ".zen"
+        log_file = work_dir / "log.md"
+        log("[COMPLETE] Step 1", log_file, work_dir)
+        log("kept", log_file, work_dir)
+        drop_lines_containing(log_file, "[COMPLETE] Step", work_dir)
+        log("after", log_file, work_dir)
+        lines = log_file.read_text().splitlines()
+        assert [line.split("] ", 1)[1] for line in lines] == ["kept", "after"]
+
 
 class TestBackupFile:
     """Tests for backup_file() function."""
@@ -217,6 +281,29 @@ class TestLog:
         assert "First" in content
         assert "Second" in content
 
+    def test_reopens_after_file_replaced(self, tmp_path):
+        log_file = tmp_path / "test.log"
+        work_dir = tmp_path / "work"
+
+        log("Before", log_file, work_dir)
+        log_file.unlink()
+        log_file.write_text("fresh\n")
+        log("After", log_file, work_dir)
+
+        content = log_file.read_text()
+        assert "Before" not in content
+        assert "fresh" in content and "After" in content
+
+    def test_write_file_then_log(self, tmp_path):
+        log_file = tmp_path / "test.log"
+
+        log("Old", log_file, tmp_path)
+        write_file(log_file, "rewritten\n")
+        log("New", log_file, tmp_path)
+
+        assert log_file.read_text().startswith("rewritten\n")
+        assert "New" in log_file.read_text()
+
 
 class TestConstants:
     """Tests for module constants."""
@@ -189,6 +189,24 @@ class TestShouldSkipJudgeGitOperations:
         assert result is True
         assert any("[JUDGE] Skipping: No changes detected" in msg for msg in log_messages)
 
+    @patch('zen_mode.judge.git.get_untracked_files')
+    @patch('zen_mode.judge.git.get_diff_stats')
+    @patch('zen_mode.judge.git.is_repo')
+    def test_new_sensitive_file_skips_numstat(self, mock_is_repo, mock_get_diff_stats, mock_get_untracked, tmp_path):
+        """A new sensitive code file forces review without running numstat."""
+        from zen_mode.judge import should_skip_judge_ctx
+
+        mock_is_repo.return_value = True
+        mock_get_untracked.return_value = ["docs/auth.md", "src/auth.py"]
+        ctx = self._make_mock_ctx(tmp_path)
+        log_messages = []
+
+        result = should_skip_judge_ctx(ctx, log_fn=log_messages.append)
+
+        assert result is False
+        mock_get_diff_stats.assert_not_called()
+        assert any("Sensitive file (src/auth.py)" in msg for msg in log_messages)
+
     @patch('zen_mode.judge.git.is_repo')
     def test_git_failure_requires_judge(self, mock_is_repo, tmp_path):
         """Not a git repo should require judge (safe default)."""
@@ -472,6 +490,86 @@ class TestGitModuleRepoState:
 
         assert has_head(tmp_path) is True
 
+    def test_is_repo_remembers_positive_answer(self, tmp_path):
+        """is_repo() only shells out until the root is confirmed a repo."""
+        import subprocess
+        from zen_mode import git
+
+        assert git.is_repo(tmp_path) is False
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        assert git.is_repo(tmp_path) is True
+
+        with patch('zen_mode.git.subprocess.run') as mock_run:
+            assert git.is_repo(tmp_path) is True
+        mock_run.assert_not_called()
+
+    def test_is_repo_dot_git_skips_subprocess(self, tmp_path):
+        """is_repo() answers from the .git directory of a real repo without git."""
+        import subprocess
+        from zen_mode import git
+
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        with patch('zen_mode.git.subprocess.run') as mock_run:
+            assert git.is_repo(tmp_path) is True
+        mock_run.assert_not_called()
+
+    def test_is_repo_false_for_empty_dot_git(self, tmp_path):
+        """An empty .git directory is not a repository."""
+        from zen_mode.git import is_repo
+
+        (tmp_path / ".git").mkdir()
+        assert is_repo(tmp_path) is False
+
+    def test_is_repo_false_for_stale_gitdir_file(self, tmp_path):
+        """A .git file pointing at a missing gitdir is not a repository."""
+        from zen_mode.git import is_repo
+
+        (tmp_path / ".git").write_text("gitdir: ../gone/.git/worktrees/wt\n")
+        assert is_repo(tmp_path) is False
+
+    def test_is_repo_true_for_worktree(self, tmp_path):
+        """A linked worktree (.git file with gitdir:) is a repository."""
+        import subprocess
+        from zen_mode.git import is_repo
+
+        main = tmp_path / "main"
+        main.mkdir()
+        subprocess.run(["git", "init"], cwd=main, capture_output=True)
+        subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=main, capture_output=True)
+        subprocess.run(["git", "config", "user.name", "Test"], cwd=main, capture_output=True)
+        subprocess.run(["git", "commit", "--allow-empty", "-m", "init"], cwd=main, capture_output=True)
+        subprocess.run(["git", "worktree", "add", str(tmp_path / "wt")], cwd=main, capture_output=True)
+
+        assert (tmp_path / "wt" / ".git").is_file()
+        assert is_repo(tmp_path / "wt") is True
+
+    def test_is_repo_true_for_subdirectory(self, tmp_path):
+        """is_repo() falls back to git when .git lives in a parent."""
+        import subprocess
+        from zen_mode.git import is_repo
+
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        sub = tmp_path / "pkg"
+        sub.mkdir()
+        assert is_repo(sub) is True
+
+    def test_repo_and_head_single_call(self, tmp_path):
+        """_repo_and_head() agrees with is_repo()/has_head() at each stage."""
+        import subprocess
+        from zen_mode.git import _repo_and_head
+
+        assert _repo_and_head(tmp_path) == (False, False)
+
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True)
+        assert _repo_and_head(tmp_path) == (True, False)
+
+        subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=tmp_path, capture_output=True)
+        subprocess.run(["git", "config", "user.name", "Test"], cwd=tmp_path, capture_output=True)
+        (tmp_path / "file.txt").write_text("content")
+        subprocess.run(["git", "add", "."], cwd=tmp_path, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "initial"], cwd=tmp_path, capture_output=True)
+        assert _repo_and_head(tmp_path) == (True, True)
+
     def test_get_head_commit_returns_hash(self, tmp_path):
         """get_head_commit() returns commit hash."""
         import subprocess
@@ -4,6 +4,8 @@ Tests for Implement phase helper functions.
 Tests linter timeout, backup logic, and prompt building.
 (Escalation tests are in test_model_escalation.py)
 """
+import os
+import subprocess
 import sys
 import threading
 import time
@@ -21,6 +23,9 @@ from zen_mode.implement import (
     build_implement_prompt,
     extract_plan_goal,
     get_step_context,
+    group_step_batches,
+    group_step_waves,
+    phase_implement_ctx,
 )
 from zen_mode.context import Context
 
@@ -132,6 +137,27 @@ class TestRunLinterWithTimeout:
         assert passed is False
         assert "timed out" in output.lower()
 
+    def test_timeout_does_not_block_exit(self, tmp_path):
+        """The interpreter exits promptly even while a timed-out lint still runs."""
+        import zen_mode
+        script = (
+            "import time\n"
+            "from zen_mode import implement\n"
+            "implement.linter.run_lint = lambda paths=None: time.sleep(60)\n"
+            "print(implement.run_linter_with_timeout(timeout=0.1, paths=['src/foo.py']))\n"
+        )
+        src_dir = str(Path(zen_mode.__file__).parents[1])
+
+        start = time.monotonic()
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=tmp_path, capture_output=True,
+            text=True, timeout=30, env={**os.environ, "PYTHONPATH": src_dir},
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "timed out" in result.stdout
+        assert time.monotonic() - start < 15
+
     @patch('zen_mode.implement.linter.run_lint')
     @patch('zen_mode.implement.git.get_changed_files')
     def test_uses_provided_paths(self, mock_git, mock_lint):
@@ -146,6 +172,65 @@ class TestRunLinterWithTimeout:
         # Should pass explicit paths to linter
         mock_lint.assert_called_once_with(paths=explicit_paths)
 
+    @patch('zen_mode.implement.linter.run_lint')
+    @patch('zen_mode.implement.git.get_changed_files')
+    def test_skips_linter_for_docs_only_changes(self, mock_git, mock_lint):
+        """Change sets the linter would skip anyway never start it."""
+        mock_git.return_value = ["README.md", "docs/guide.rst", "logo.png"]
+
+        passed, output = run_linter_with_timeout(timeout=5)
+
+        assert passed is True
+        assert "PASS" in output
+        mock_lint.assert_not_called()
+
+    @patch('zen_mode.implement.linter.run_lint')
+    def test_lints_only_lintable_paths(self, mock_lint):
+        """Docs are dropped from a mixed change set before linting."""
+        mock_lint.return_value = (True, "")
+
+        run_linter_with_timeout(paths=["README.md", "src/app.py"])
+
+        mock_lint.assert_called_once_with(paths=["src/app.py"])
+
+    @patch('zen_mode.implement.linter.run_lint')
+    def test_reuses_pass_for_unchanged_files(self, mock_lint, tmp_path):
+        """Unchanged files that passed aren't linted again."""
+        target = tmp_path / "clean.py"
+        target.write_text("x = 1\n")
+        mock_lint.return_value = (True, "ok")
+
+        assert run_linter_with_timeout(paths=[str(target)]) == (True, "ok")
+        assert run_linter_with_timeout(paths=[str(target)]) == (True, "ok")
+
+        assert mock_lint.call_count == 1
+
+    @patch('zen_mode.implement.linter.run_lint')
+    def test_relints_after_file_changes(self, mock_lint, tmp_path):
+        """Modifying a file invalidates the cached pass."""
+        target = tmp_path / "changing.py"
+        target.write_text("x = 1\n")
+        mock_lint.return_value = (True, "")
+        run_linter_with_timeout(paths=[str(target)])
+
+        target.write_text("x = 1  # TODO\n")
+        mock_lint.return_value = (False, "TODO found")
+
+        assert run_linter_with_timeout(paths=[str(target)]) == (False, "TODO found")
+        assert mock_lint.call_count == 2
+
+    @patch('zen_mode.implement.linter.run_lint')
+    def test_failures_not_cached(self, mock_lint, tmp_path):
+        """A failing result is always re-checked."""
+        target = tmp_path / "bad.py"
+        target.write_text("x = 1\n")
+        mock_lint.return_value = (False, "bad")
+
+        run_linter_with_timeout(paths=[str(target)])
+        run_linter_with_timeout(paths=[str(target)])
+
+        assert mock_lint.call_count == 2
+
 
 class TestBackupScoutFilesCtx:
     """Tests for backup_scout_files_ctx() function."""
@@ -210,6 +295,27 @@ Files to modify:
         backup_nonexistent = mock_ctx.backup_dir / "nonexistent.py"
         assert not backup_nonexistent.exists()
 
+    def test_backs_up_duplicate_mentions_once(self, mock_ctx):
+        """A file listed several times is copied once."""
+        mock_ctx.scout_file.write_text("- `src/main.py`\n- `src/main.py` again\n")
+
+        backup_scout_files_ctx(mock_ctx)
+
+        log_text = mock_ctx.log_file.read_text()
+        assert log_text.count("[BACKUP]") == 1
+
+    def test_backs_up_many_files(self, mock_ctx):
+        """All listed files are backed up when copies run concurrently."""
+        names = [f"src/mod_{i}.py" for i in range(20)]
+        for name in names:
+            (mock_ctx.project_root / name).write_text(name)
+        mock_ctx.scout_file.write_text("\n".join(f"- `{n}`" for n in names))
+
+        backup_scout_files_ctx(mock_ctx)
+
+        for name in names:
+            assert (mock_ctx.backup_dir / name).read_text() == name
+
     def test_handles_empty_scout(self, mock_ctx):
         """backup_scout_files_ctx handles empty scout file."""
         mock_ctx.scout_file.write_text("")
@@ -366,3 +472,223 @@ class TestBuildImplementPrompt:
 
         assert "STEP_COMPLETE" in prompt
         assert "STEP_BLOCKED" in prompt
+
+
+class TestGroupStepWaves:
+    """Tests for group_step_waves() scheduling."""
+
+    STEPS = [(1, "Add a"), (2, "Add b"), (3, "Wire a and b"), (4, "Verify")]
+
+    def test_serial_when_max_parallel_is_one(self):
+        files = {1: {"a.py"}, 2: {"b.py"}}
+        waves = group_step_waves(self.STEPS, [0, 1, 2, 3], files, 1)
+        assert waves == [[0], [1], [2], [3]]
+
+    def test_disjoint_steps_share_wave(self):
+        files = {1: {"a.py"}, 2: {"b.py"}, 3: {"a.py", "main.py"}}
+        waves = group_step_waves(self.STEPS, [0, 1, 2, 3], files, 4)
+        assert waves == [[0, 1], [2], [3]]
+
+    def test_undeclared_files_are_barriers(self):
+        files = {1: {"a.py"}, 3: {"c.py"}}
+        waves = group_step_waves(self.STEPS, [0, 1, 2, 3], files, 4)
+        assert waves == [[0], [1], [2], [3]]
+
+    def test_final_step_runs_alone(self):
+        files = {1: {"a.py"}, 2: {"b.py"}, 3: {"c.py"}, 4: {"tests/test_a.py"}}
+        waves = group_step_waves(self.STEPS, [0, 1, 2, 3], files, 4)
+        assert waves == [[0, 1, 2], [3]]
+
+    def test_wave_size_capped(self):
+        files = {1: {"a.py"}, 2: {"b.py"}, 3: {"c.py"}}
+        waves = group_step_waves(self.STEPS, [0, 1, 2, 3], files, 2)
+        assert waves == [[0, 1], [2], [3]]
+
+    def test_skips_completed_steps(self):
+        files = {1: {"a.py"}, 2: {"b.py"}, 3: {"c.py"}}
+        waves = group_step_waves(self.STEPS, [1, 2, 3], files, 4)
+        assert waves == [[1, 2], [3]]
+
+
+class TestGroupStepBatches:
+    """Tests for group_step_batches() scheduling."""
+
+    STEPS = [(1, "Add a"), (2, "Add b"), (3, "Wire a and b"), (4, "Verify")]
+
+    def test_no_batching_when_max_is_one(self):
+        assert group_step_batches(self.STEPS, [0, 1, 2, 3], 1) == [[0], [1], [2], [3]]
+
+    def test_adjacent_steps_batched_final_alone(self):
+        assert group_step_batches(self.STEPS, [0, 1, 2, 3], 4) == [[0, 1, 2], [3]]
+
+    def test_batch_size_capped(self):
+        assert group_step_batches(self.STEPS, [0, 1, 2, 3], 2) == [[0, 1], [2], [3]]
+
+    def test_completed_step_splits_batch(self):
+        assert group_step_batches(self.STEPS, [0, 2, 3], 4) == [[0], [2], [3]]
+
+
+class TestBatchedImplement:
+    """Tests for running consecutive steps in one Claude call."""
+
+    PLAN = """## Step 1: Add a
+## Step 2: Add b
+## Step 3: Verify with tests
+"""
+
+    @pytest.fixture
+    def ctx(self, tmp_path):
+        work_dir = tmp_path / ".zen"
+        work_dir.mkdir()
+        (work_dir / "plan.md").write_text(self.PLAN)
+        (work_dir / "scout.md").write_text("")
+        return Context(work_dir=work_dir, task_file="task.md", project_root=tmp_path)
+
+    @patch('zen_mode.implement.MAX_BATCH_STEPS', 4)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_batch_completes_in_one_call(self, mock_claude, mock_linter, ctx):
+        """Steps 1-2 share a call; the final step still runs alone."""
+        mock_claude.side_effect = ["Done.\nSTEP_COMPLETE: 1\nDone.\nSTEP_COMPLETE: 2", "STEP_COMPLETE"]
+        mock_linter.return_value = (True, "")
+
+        phase_implement_ctx(ctx)
+
+        assert mock_claude.call_count == 2
+        batch_prompt = mock_claude.call_args_list[0].args[0]
+        assert "Step 1: Add a" in batch_prompt and "Step 2: Add b" in batch_prompt
+        log_text = ctx.log_file.read_text()
+        assert "[BATCH] Steps 1, 2" in log_text
+        for num in (1, 2, 3):
+            assert f"[COMPLETE] Step {num}" in log_text
+
+    @patch('zen_mode.implement.MAX_BATCH_STEPS', 4)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_partial_batch_falls_back_to_single_steps(self, mock_claude, mock_linter, ctx):
+        """Steps the batch didn't finish run individually, in order."""
+        mock_claude.side_effect = ["STEP_COMPLETE: 1\nSTEP_BLOCKED: 2 unclear", "STEP_COMPLETE", "STEP_COMPLETE"]
+        mock_linter.return_value = (True, "")
+
+        phase_implement_ctx(ctx)
+
+        assert mock_claude.call_count == 3
+        assert "Execute Step 2" in mock_claude.call_args_list[1].args[0]
+        log_text = ctx.log_file.read_text()
+        assert "[BATCH] Continuing from Step 2" in log_text
+        assert log_text.count("[COMPLETE] Step 1") == 1
+
+    @patch('zen_mode.implement.MAX_BATCH_STEPS', 4)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_lint_failure_discards_batch(self, mock_claude, mock_linter, ctx):
+        """A failing lint after the batch leaves every step to the single-step loop."""
+        mock_claude.side_effect = ["STEP_COMPLETE: 1\nSTEP_COMPLETE: 2", "STEP_COMPLETE", "STEP_COMPLETE", "STEP_COMPLETE"]
+        mock_linter.side_effect = [(False, "E1 bad"), (True, ""), (True, ""), (True, "")]
+
+        phase_implement_ctx(ctx)
+
+        assert mock_claude.call_count == 4
+        log_text = ctx.log_file.read_text()
+        assert "[LINT FAIL] Batch" in log_text
+        assert "already contains the batch's edits for Steps 1, 2" in log_text
+
+    @pytest.mark.bypass_conftest_patch
+    @patch('zen_mode.implement.MAX_BATCH_STEPS', 4)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    def test_markers_from_earlier_stream_events_count(self, mock_linter, ctx, tmp_path, monkeypatch):
+        """A STEP_COMPLETE emitted before later tool calls still marks its step done."""
+        import json
+        monkeypatch.setenv("ZEN_SKIP_PERMISSIONS", "false")
+        mock_linter.return_value = (True, "")
+        events = [
+            {"type": "assistant", "message": {"id": "m1", "stop_reason": None, "content": [
+                {"type": "text", "text": "Added a.\nSTEP_COMPLETE: 1"}]}},
+            {"type": "assistant", "message": {"id": "m1", "stop_reason": "tool_use", "content": [
+                {"type": "tool_use", "name": "Edit", "input": {}}]}},
+            {"type": "user", "message": {"content": [{"type": "tool_result", "content": "ok"}]}},
+            {"type": "assistant", "message": {"id": "m2", "stop_reason": "end_turn", "content": [
+                {"type": "text", "text": "Added b.\nSTEP_COMPLETE: 2"}]}},
+            {"type": "result", "result": "Added b.\nSTEP_COMPLETE: 2", "total_cost_usd": 0.01},
+        ]
+        calls = tmp_path / "calls.txt"
+        script = tmp_path / "fake_claude.py"
+        lines = "\n".join(f"print({json.dumps(json.dumps(e))}, flush=True)" for e in events)
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "sys.stdin.read()\n"
+            f"open({str(calls)!r}, 'a').write('call\\n')\n"
+            f"{lines}\n"
+        )
+        script.chmod(0o755)
+
+        with patch('zen_mode.claude._init_claude', return_value=str(script)):
+            phase_implement_ctx(ctx)
+
+        # One batch call for Steps 1-2, one single-step call for Step 3
+        assert calls.read_text().count("call") == 2
+        log_text = ctx.log_file.read_text()
+        assert "[BATCH] Continuing" not in log_text
+        for num in (1, 2, 3):
+            assert log_text.count(f"[COMPLETE] Step {num}") == 1
+
+
+class TestParallelImplement:
+    """Tests for concurrent execution of independent steps."""
+
+    PLAN = """## Step 1: Add a
+Files: `a.py`
+## Step 2: Add b
+Files: `b.py`
+## Step 3: Verify with tests
+"""
+
+    @pytest.fixture
+    def ctx(self, tmp_path):
+        work_dir = tmp_path / ".zen"
+        work_dir.mkdir()
+        (work_dir / "plan.md").write_text(self.PLAN)
+        (work_dir / "scout.md").write_text("")
+        return Context(work_dir=work_dir, task_file="task.md", project_root=tmp_path)
+
+    @patch('zen_mode.implement.MAX_PARALLEL_STEPS', 4)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_disjoint_steps_run_concurrently(self, mock_claude, mock_linter, ctx):
+        """Steps 1 and 2 overlap in time; lint is scoped to each step's files."""
+        barrier = threading.Barrier(2, timeout=5)
+        calls = []
+
+        def fake_claude(prompt, model=None, **kwargs):
+            calls.append(prompt)
+            if len(calls) <= 2:
+                # Deadlocks (BrokenBarrierError) unless steps 1 and 2 overlap
+                barrier.wait()
+            return "STEP_COMPLETE"
+
+        mock_claude.side_effect = fake_claude
+        mock_linter.return_value = (True, "")
+
+        phase_implement_ctx(ctx)
+
+        assert mock_claude.call_count == 3
+        lint_paths = sorted(tuple(c.kwargs["paths"] or ()) for c in mock_linter.call_args_list)
+        assert lint_paths == [(), (str(ctx.project_root / "a.py"),), (str(ctx.project_root / "b.py"),)]
+        log_text = ctx.log_file.read_text()
+        assert "[PARALLEL] Steps 1, 2" in log_text
+        assert "[COMPLETE] Step 1" in log_text
+        assert "[COMPLETE] Step 2" in log_text
+        assert "[COMPLETE] Step 3" in log_text
+
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_serial_by_default(self, mock_claude, mock_linter, ctx):
+        """Without ZEN_PARALLEL_STEPS, steps run one at a time."""
+        mock_claude.return_value = "STEP_COMPLETE"
+        mock_linter.return_value = (True, "")
+
+        phase_implement_ctx(ctx)
+
+        assert mock_claude.call_count == 3
+        assert "[PARALLEL]" not in ctx.log_file.read_text()
@@ -218,3 +218,124 @@ class TestModelEscalation:
             lint_failed_count = final_prompt.count("LINT FAILED")
             assert lint_failed_count == 0, \
                 f"Escalation prompt should not contain accumulated LINT FAILED sections, got {lint_failed_count}"
+
+
+class TestRetryPrompts:
+    """Tests for retry prompt construction between escalation attempts."""
+
+    @pytest.fixture
+    def mock_ctx(self, tmp_path):
+        work_dir = tmp_path / ".zen"
+        work_dir.mkdir()
+        (work_dir / "plan.md").write_text("## Step 1: Do something\n")
+        (work_dir / "scout.md").write_text("")
+        return Context(work_dir=work_dir, task_file="task.md", project_root=tmp_path)
+
+    @patch('zen_mode.implement.MAX_RETRIES', 4)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_lint_feedback_carried_into_retry(self, mock_claude, mock_linter, mock_ctx):
+        """A retry prompt includes the lint failure from the previous attempt."""
+        from zen_mode.implement import phase_implement_ctx
+
+        captured_prompts = []
+
+        def capture_prompt(prompt, model=None, **kwargs):
+            captured_prompts.append(prompt)
+            return "STEP_COMPLETE"
+
+        mock_claude.side_effect = capture_prompt
+        mock_linter.side_effect = [(False, "undefined name 'qux'"), (True, "")]
+
+        phase_implement_ctx(mock_ctx)
+
+        assert len(captured_prompts) == 2
+        assert "LINT FAILED" in captured_prompts[1]
+        assert "qux" in captured_prompts[1]
+
+    @patch('zen_mode.implement.ESCALATE_ON_REPEAT', False)
+    @patch('zen_mode.implement.MAX_RETRIES', 5)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_identical_retry_prompt_skipped(self, mock_claude, mock_linter, mock_ctx):
+        """A retry identical to one whose lint feedback came back unchanged isn't re-sent."""
+        from zen_mode.exceptions import ImplementError
+        from zen_mode.implement import phase_implement_ctx
+
+        models = []
+
+        def record_model(prompt, model=None, **kwargs):
+            models.append(model)
+            return "STEP_COMPLETE"
+
+        mock_claude.side_effect = record_model
+        mock_linter.return_value = (False, "same error")
+
+        with pytest.raises(ImplementError):
+            phase_implement_ctx(mock_ctx)
+
+        # Attempt 3 got the "same as a previous attempt" feedback and produced
+        # it again, so attempt 4 would be identical; escalation still runs
+        assert models == [MODEL_HANDS, MODEL_HANDS, MODEL_HANDS, MODEL_BRAIN]
+        assert "[SKIP] Step 1: identical retry prompt" in mock_ctx.log_file.read_text()
+
+    @pytest.mark.parametrize("response", [None, "still thinking"])
+    @patch('zen_mode.implement.MAX_RETRIES', 4)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_failed_responses_use_every_retry(self, mock_claude, mock_linter, response, mock_ctx):
+        """Timeouts (None) and missing STEP_COMPLETE retry even with an unchanged prompt."""
+        from zen_mode.exceptions import ImplementError
+        from zen_mode.implement import phase_implement_ctx
+
+        models = []
+
+        def no_completion(prompt, model=None, **kwargs):
+            models.append(model)
+            return response
+
+        mock_claude.side_effect = no_completion
+
+        with pytest.raises(ImplementError):
+            phase_implement_ctx(mock_ctx)
+
+        assert models == [MODEL_HANDS, MODEL_HANDS, MODEL_HANDS, MODEL_BRAIN]
+        assert "[SKIP]" not in mock_ctx.log_file.read_text()
+
+    @patch('zen_mode.implement.ESCALATE_ON_REPEAT', True)
+    @patch('zen_mode.implement.MAX_RETRIES', 4)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_repeated_lint_failure_escalates_early(self, mock_claude, mock_linter, mock_ctx):
+        """With ZEN_ESCALATE_ON_REPEAT, a repeated lint failure skips to MODEL_BRAIN."""
+        from zen_mode.implement import phase_implement_ctx
+
+        models = []
+
+        def record_model(prompt, model=None, **kwargs):
+            models.append(model)
+            return "STEP_COMPLETE"
+
+        mock_claude.side_effect = record_model
+        mock_linter.side_effect = [(False, "same error"), (False, "same error"), (True, "")]
+
+        phase_implement_ctx(mock_ctx)
+
+        assert models == [MODEL_HANDS, MODEL_HANDS, MODEL_BRAIN]
+
+    @patch('zen_mode.implement.ESCALATE_ON_REPEAT', True)
+    @patch('zen_mode.implement.MAX_RETRIES', 4)
+    @patch('zen_mode.implement.run_linter_with_timeout')
+    @patch('zen_mode.implement.run_claude')
+    def test_early_escalation_is_final_attempt(self, mock_claude, mock_linter, mock_ctx):
+        """A failed early escalation ends the step instead of retrying further."""
+        from zen_mode.exceptions import ImplementError
+        from zen_mode.implement import phase_implement_ctx
+
+        mock_claude.return_value = "STEP_COMPLETE"
+        mock_linter.return_value = (False, "same error")
+
+        with pytest.raises(ImplementError, match="after 3 attempts"):
+            phase_implement_ctx(mock_ctx)
+
+        assert mock_claude.call_count == 3
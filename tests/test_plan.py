@@ -9,7 +9,7 @@ from pathlib import Path
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-from zen_mode.plan import validate_plan_has_interfaces, parse_steps
+from zen_mode.plan import validate_plan_has_interfaces, parse_steps, parse_step_files
 
 
 class TestValidatePlanHasInterfaces:
@@ -157,6 +157,23 @@ Step 2: Do that
         steps = parse_steps(plan)
         assert len(steps) == 2
 
+    def test_flexible_multiline_description(self):
+        """Flexible step bodies run until the next step header."""
+        plan = """Step 1: Add function
+  with a docstring
+Step 2: Update tests
+"""
+        steps = parse_steps(plan)
+        assert steps == [(1, "Add function\n  with a docstring"), (2, "Update tests")]
+
+    def test_flexible_header_without_description(self):
+        """A bare header doesn't swallow the following step."""
+        plan = """Step 1:
+2. Second step
+"""
+        steps = parse_steps(plan)
+        assert steps == [(1, ""), (2, "Second step")]
+
     def test_bullet_fallback(self):
         """Fall back to bullets if no numbered steps."""
         plan = """- Do this first
@@ -165,3 +182,76 @@ Step 2: Do that
 """
         steps = parse_steps(plan)
         assert len(steps) == 3
+
+
+class TestParseStepFiles:
+    """Tests for parse_step_files() function."""
+
+    def test_maps_steps_to_backticked_files(self):
+        """Collect every backticked path on a step's Files: line."""
+        plan = """## Step 1: Add model
+Files: `src/models/user.py`
+Action: Create class
+
+## Step 2: Add endpoint
+Files: `src/api/auth.py` (modify), `src/models/user.py` (read)
+Action: Add route
+"""
+        assert parse_step_files(plan) == {
+            1: {"src/models/user.py"},
+            2: {"src/api/auth.py", "src/models/user.py"},
+        }
+
+    def test_bold_files_label(self):
+        """Accept **Files:** as written by some plans."""
+        plan = "## Step 1: Edit\n**Files:** `a.py`\n"
+        assert parse_step_files(plan) == {1: {"a.py"}}
+
+    def test_steps_without_files_omitted(self):
+        """Steps with no Files: line are left out of the mapping."""
+        plan = """## Step 1: Edit
+Files: `a.py`
+## Step 2: Verify
+Action: Run pytest
+"""
+        assert parse_step_files(plan) == {1: {"a.py"}}
+
+    def test_files_line_not_borrowed_from_next_step(self):
+        """A Files: line belongs only to the step it appears under."""
+        plan = """## Step 1: Think
+## Step 2: Edit
+Files: `b.py`
+"""
+        assert parse_step_files(plan) == {2: {"b.py"}}
+
+
+class TestReadPlan:
+    """Tests for Context.read_plan() caching."""
+
+    def _ctx(self, tmp_path):
+        from zen_mode.context import Context
+        work_dir = tmp_path / ".zen"
+        work_dir.mkdir()
+        return Context(work_dir=work_dir, task_file="task.md", project_root=tmp_path)
+
+    def test_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """Repeat calls reuse the text; a rewrite is picked up."""
+        from zen_mode.files import write_file
+        ctx = self._ctx(tmp_path)
+        write_file(ctx.plan_file, "## Step 1: First\n", ctx.work_dir)
+        assert ctx.read_plan() == "## Step 1: First\n"
+
+        reads = []
+        original = Path.read_text
+        monkeypatch.setattr(Path, "read_text", lambda self, *a, **k: reads.append(self) or original(self, *a, **k))
+        ctx.read_plan()
+        assert reads == []
+
+        write_file(ctx.plan_file, "## Step 1: Second plan\n", ctx.work_dir)
+        assert ctx.read_plan() == "## Step 1: Second plan\n"
+        assert len(reads) == 1
+
+    def test_missing_plan_raises(self, tmp_path):
+        ctx = self._ctx(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            ctx.read_plan()
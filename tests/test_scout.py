@@ -10,14 +10,23 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import zen_mode.scout as scout_mod
 from zen_mode.scout import (
     parse_targeted_files,
     grep_impact,
     expand_dependencies,
     append_grep_impact_to_scout,
+    finalize_scout,
 )
 
 
+@pytest.fixture(autouse=True)
+def no_ripgrep():
+    """Pin grep_impact to the git grep path; ripgrep tests opt back in."""
+    with patch("zen_mode.scout._ripgrep", return_value=None):
+        yield
+
+
 class TestParseTargetedFiles:
     """Tests for parse_targeted_files() function."""
 
@@ -188,6 +197,54 @@ class TestGrepImpact:
             assert "*.py" in cmd or ".py" in str(cmd)
             assert "*.ts" in cmd or ".ts" in str(cmd)
 
+    def test_prefers_ripgrep_when_installed(self, tmp_path):
+        """ripgrep is used with fixed-string stems when on PATH."""
+        (tmp_path / "caller.py").write_text("import utils\n")
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "./caller.py\n"
+
+        with patch("zen_mode.scout._ripgrep", return_value="rg"), \
+                patch("subprocess.run", return_value=mock_result) as mock_run:
+            result = grep_impact(["src/utils.py"], tmp_path)
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:4] == ["rg", "--no-config", "-l", "-F"]
+        assert "*.py" in cmd
+        assert result == {"src/utils.py": ["caller.py"]}
+
+    def test_ripgrep_paths_match_targets(self, tmp_path):
+        """ripgrep's ./-prefixed paths are normalized, so targets skip themselves."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "utils.py").write_text("def utils(): pass\n")
+        (tmp_path / "src" / "caller.py").write_text("import utils\n")
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "./src/utils.py\n./src/caller.py\n"
+
+        with patch("zen_mode.scout._ripgrep", return_value="rg"), \
+                patch("subprocess.run", return_value=mock_result):
+            result = grep_impact(["src/utils.py"], tmp_path)
+
+        assert result == {"src/utils.py": ["src/caller.py"]}
+
+    def test_falls_back_to_git_grep_on_ripgrep_error(self, tmp_path):
+        """A ripgrep error (exit 2) falls back to git grep."""
+        (tmp_path / "caller.py").write_text("import utils\n")
+
+        rg_result = MagicMock(returncode=2, stdout="")
+        git_result = MagicMock(returncode=0, stdout="caller.py\n")
+
+        with patch("zen_mode.scout._ripgrep", return_value="rg"), \
+                patch("subprocess.run", side_effect=[rg_result, git_result]) as mock_run:
+            result = grep_impact(["src/utils.py"], tmp_path)
+
+        assert mock_run.call_args[0][0][0] == "git"
+        assert result == {"src/utils.py": ["caller.py"]}
+
 
 class TestExpandDependencies:
     """Tests for expand_dependencies() function.
@@ -311,3 +368,40 @@ class TestAppendGrepImpactToScout:
             )
 
         assert any("2 files" in msg for msg in log_messages)
+
+
+class TestFinalizeScout:
+    """Tests for finalize_scout() function."""
+
+    def test_annotates_and_appends_in_one_write(self, tmp_path):
+        """Size tags and grep impact both land in a single rewrite."""
+        (tmp_path / "utils.py").write_text("# line\n" * 600)
+        (tmp_path / "caller.py").write_text("from utils import something\n")
+        scout_file = tmp_path / "scout.md"
+        content = "## Targeted Files\n- `utils.py`: target\n"
+        scout_file.write_text(content)
+
+        mock_result = MagicMock(returncode=0, stdout="caller.py\n")
+        with patch("subprocess.run", return_value=mock_result), \
+                patch("zen_mode.scout.write_file", wraps=scout_mod.write_file) as mock_write:
+            finalize_scout(scout_file, content, ["utils.py"], tmp_path)
+
+        mock_write.assert_called_once()
+        assert scout_file.read_text() == (
+            "## Targeted Files\n- `utils.py` [LARGE]: target\n"
+            "\n## Grep Impact (callers/importers)\n"
+            "- `caller.py`: references targeted file\n"
+        )
+
+    def test_leaves_file_alone_when_nothing_to_add(self, tmp_path):
+        """No impact and no tags means no rewrite."""
+        scout_file = tmp_path / "scout.md"
+        content = "## Targeted Files\n- `orphan.py`: target\n"
+        scout_file.write_text(content)
+
+        mock_result = MagicMock(returncode=1, stdout="")
+        with patch("subprocess.run", return_value=mock_result), \
+                patch("zen_mode.scout.write_file") as mock_write:
+            finalize_scout(scout_file, content, ["orphan.py"], tmp_path)
+
+        mock_write.assert_not_called()
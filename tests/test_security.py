@@ -258,6 +258,27 @@ class TestTrustRoots:
         from zen_mode.claude import is_trusted_directory
         assert is_trusted_directory(untrusted) is False
 
+    def test_trust_roots_rejects_sibling_with_shared_prefix(self, tmp_path, monkeypatch):
+        """A sibling whose name extends the root's name is not inside it."""
+        trusted = tmp_path / "proj"
+        trusted.mkdir()
+        sibling = tmp_path / "proj-evil"
+        sibling.mkdir()
+        monkeypatch.setenv("ZEN_TRUST_ROOTS", str(trusted))
+
+        from zen_mode.claude import is_trusted_directory
+        assert is_trusted_directory(sibling) is False
+
+    def test_trust_roots_missing_path_still_raises(self, tmp_path, monkeypatch):
+        """A nonexistent root is rejected on every call, not cached."""
+        from zen_mode.exceptions import ConfigError
+        monkeypatch.setenv("ZEN_TRUST_ROOTS", str(tmp_path / "gone"))
+
+        from zen_mode.claude import is_trusted_directory
+        for _ in range(2):
+            with pytest.raises(ConfigError):
+                is_trusted_directory(tmp_path)
+
     def test_trust_roots_multiple_roots(self, tmp_path, monkeypatch):
         """Multiple trust roots are all checked."""
         root1 = tmp_path / "root1"
@@ -7,6 +7,7 @@ from zen_mode.verify import (
     VerifyTimeout,
     FixResult,
     truncate_preserve_tail,
+    read_output_tail,
     extract_filenames,
     verify_test_output,
     detect_no_tests,
@@ -122,6 +123,28 @@ class TestTruncatePreserveTail:
         assert "HEAD" in result
 
 
+class TestReadOutputTail:
+    """Test read_output_tail helper function."""
+
+    def test_small_file_read_whole(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_bytes(b"short output")
+        assert read_output_tail(path, 100) == b"short output"
+
+    def test_large_file_keeps_tail(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_bytes(b"HEAD" + b"x" * 100 + b"TAIL")
+        result = read_output_tail(path, 10)
+        assert result.endswith(b"TAIL")
+        assert len(result) == 10
+
+    def test_realigns_split_utf8(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_bytes(("x" * 20 + "\u00e9\u00e9" + "done").encode("utf-8"))
+        result = read_output_tail(path, 7)  # cuts inside the first e-acute
+        assert result.decode("utf-8") == "\u00e9done"
+
+
 class TestExtractFilenames:
     """Test extract_filenames helper function."""
 
@@ -267,6 +290,20 @@ class TestPhaseVerifyMocked:
         state, output = phase_verify(ctx)
         assert state == VerifyState.PASS
 
+    @patch('zen_mode.verify.run_claude')
+    def test_large_output_keeps_summary(self, mock_run_claude, tmp_path):
+        ctx = make_test_context(tmp_path)
+
+        noise = "tests/test_x.py::test_case PASSED\r\n" * 5000
+        ctx.test_output_file.write_text(noise + "===== 2 failed, 5000 passed in 9.1s =====\n")
+
+        mock_run_claude.return_value = "Tests completed."
+
+        state, output = phase_verify(ctx)
+        assert state == VerifyState.FAIL
+        assert "\r" not in output
+        assert output.endswith("=====\n")
+
 
 class TestPhaseFixTestsMocked:
     """Test phase_fix_tests with mocked Claude calls."""
@@ -394,6 +431,22 @@ class TestDetectProjectRuntime:
         runtime, available = detect_project_runtime(tmp_path)
         assert runtime == "cargo"
 
+    def test_detects_wildcard_config(self, tmp_path):
+        (tmp_path / "App.csproj").write_text("<Project />")
+        runtime, available = detect_project_runtime(tmp_path)
+        assert runtime == "dotnet"
+
+    def test_config_case_follows_filesystem(self, tmp_path):
+        (tmp_path / "gemfile").write_text("")
+        runtime, available = detect_project_runtime(tmp_path)
+        expected = "ruby" if (tmp_path / "Gemfile").exists() else None
+        assert runtime == expected
+
+    def test_wildcard_config_matches_dotfile(self, tmp_path):
+        (tmp_path / ".App.csproj").write_text("<Project />")
+        runtime, available = detect_project_runtime(tmp_path)
+        assert runtime == "dotnet"
+
 
 class TestTestCommandHints:
     """Test TEST_COMMANDS mapping."""